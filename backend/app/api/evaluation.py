@@ -31,7 +31,7 @@ from app.schemas.evaluation import (
     EvaluationResponse,
     SolutionFeedback,
 )
-from app.services.feedback_persistence import save_feedback
+from app.services.feedback_persistence import save_feedback_async
 from app.services.session_store import Session, session_store
 
 router = APIRouter(tags=["evaluation"])
@@ -177,7 +177,8 @@ async def evaluate_solution(
     feedback: SolutionFeedback = result.final_output
 
     project_root = Path(__file__).parent.parent.parent.parent
-    feedback_path = save_feedback(
+    # Written in a worker thread so the event loop is free during the disk write
+    feedback_path = await save_feedback_async(
         feedback=feedback,
         company_name=session.company_name,
         role=session.role,
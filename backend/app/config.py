@@ -35,6 +35,11 @@ class Settings(BaseSettings):
     company_research_agent_timeout: float = 60.0
     drill_generation_agent_timeout: float = 90.0
 
+    # Company Research Cache
+    company_research_cache_ttl: float = 86400.0  # Seconds a summary is reused per company/role
+    company_research_cache_max_size: int = 512  # Oldest entry evicted beyond this
+    dedupe_search_queries: bool = True  # Skip planner searches that repeat a query
+
     # GitHub Scout Configuration
     github_token: str = ""  # Personal access token with public_repo read access
     scout_db_path: str = "data/scout.db"  # SQLite DB; dir auto-created by GitHubReposDB
@@ -42,6 +47,7 @@ class Settings(BaseSettings):
     scout_max_repos: int = 50  # Max repos returned from GitHub search
     scout_max_daily_analyses: int = 100  # Rate limit: analyses per day
     scout_batch_size: int = 10  # Repos analyzed per LLM call
+    scout_max_concurrent_batches: int = 4  # LLM analysis batches in flight at once
 
 
 settings = Settings()
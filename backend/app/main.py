@@ -1,3 +1,5 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -9,10 +11,19 @@ load_dotenv(Path(__file__).parent.parent.parent / ".env")
 
 from app.api import router as api_router  # noqa: E402
 from app.config import settings  # noqa: E402
+from app.services.github_repos_db import github_repos_db  # noqa: E402
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    await github_repos_db.close()
+
 
 app = FastAPI(
     title="YoureHired API",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -1,4 +1,5 @@
 import asyncio
+import time
 from collections.abc import AsyncGenerator
 
 from agents.exceptions import (
@@ -18,6 +19,50 @@ from app.schemas.company_info import CompanySummary, SearchPlan, SearchQuery
 from app.services.session_store import Session, session_store
 from app.services.task_registry import run_agent_streamed
 
+# Research summaries keyed by normalized (company_name, role) -> (expires_at, summary).
+# In-memory and per-process, like the session store. Insertion order doubles as
+# recency order: hits are moved to the end, so the first key is least recently used.
+_research_cache: dict[tuple[str, str], tuple[float, CompanySummary]] = {}
+
+
+def _cache_key(company_name: str, role: str) -> tuple[str, str]:
+    return company_name.strip().lower(), role.strip().lower()
+
+
+def get_cached_research(company_name: str, role: str) -> CompanySummary | None:
+    """Return a cached summary for company/role, or None if missing or expired."""
+    key = _cache_key(company_name, role)
+    entry = _research_cache.pop(key, None)
+    if entry is None:
+        return None
+    expires_at, summary = entry
+    if time.monotonic() >= expires_at:
+        return None
+    _research_cache[key] = entry  # Reinsert as most recently used
+    return summary
+
+
+def _evict_expired(now: float) -> None:
+    expired = [key for key, (expires_at, _) in _research_cache.items() if now >= expires_at]
+    for key in expired:
+        del _research_cache[key]
+
+
+def cache_research(company_name: str, role: str, summary: CompanySummary) -> None:
+    """Store a research summary, evicting expired entries, then the least recently used."""
+    key = _cache_key(company_name, role)
+    now = time.monotonic()
+    _research_cache.pop(key, None)
+    if len(_research_cache) >= settings.company_research_cache_max_size:
+        _evict_expired(now)
+    if len(_research_cache) >= settings.company_research_cache_max_size:
+        _research_cache.pop(next(iter(_research_cache)))
+    _research_cache[key] = (now + settings.company_research_cache_ttl, summary)
+
+
+def clear_research_cache() -> None:
+    _research_cache.clear()
+
 
 async def _plan_searches(company_name: str, role: str, session_id: str) -> SearchPlan:
     """Generate search plan with timeout."""
@@ -31,6 +76,26 @@ async def _plan_searches(company_name: str, role: str, session_id: str) -> Searc
     return output  # type: ignore[no-any-return]
 
 
+def _dedupe_searches(searches: list[SearchQuery]) -> list[SearchQuery]:
+    """Collapse searches whose queries match after case/whitespace normalization.
+
+    Reasons of dropped duplicates are merged into the kept search so the
+    search agent still sees the full context.
+    """
+    # Normalized query -> (first query as written, distinct reasons in order)
+    unique: dict[str, tuple[str, list[str]]] = {}
+    for item in searches:
+        key = " ".join(item.query.lower().split())
+        if key not in unique:
+            unique[key] = (item.query, [item.reason])
+        elif item.reason not in unique[key][1]:
+            unique[key][1].append(item.reason)
+    return [
+        SearchQuery(query=query, reason="; ".join(reasons))
+        for query, reasons in unique.values()
+    ]
+
+
 async def _run_single_search(
     item: SearchQuery, session_id: str
 ) -> tuple[str, str | None, str]:
@@ -76,43 +141,68 @@ async def _execute_searches(
     """
     Execute searches in parallel, streaming progress.
     Yields status events (dict) and successful results (str).
+
+    Uses asyncio.wait instead of as_completed so searches still running
+    when the consumer stops early are cancelled rather than orphaned.
     """
-    tasks = [
+    pending = {
         asyncio.create_task(_run_single_search(item, session_id))
         for item in searches
-    ]
-    total = len(tasks)
+    }
+    total = len(pending)
     completed = 0
 
-    for coro in asyncio.as_completed(tasks):
-        reason, result, status = await coro
-        completed += 1
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                reason, result, status = task.result()
+                completed += 1
 
-        if status == "success":
-            msg = f"Completed ({completed}/{total}): {reason}"
-        elif status == "timed_out":
-            msg = f"Timed out ({completed}/{total}): {reason}, continuing..."
-        else:
-            msg = f"Failed ({completed}/{total}): {reason}, continuing..."
-        yield {"type": "status", "message": msg}
+                if status == "success":
+                    msg = f"Completed ({completed}/{total}): {reason}"
+                elif status == "timed_out":
+                    msg = f"Timed out ({completed}/{total}): {reason}, continuing..."
+                else:
+                    msg = f"Failed ({completed}/{total}): {reason}, continuing..."
+                yield {"type": "status", "message": msg}
 
-        if status == "success" and result is not None:
-            yield result
+                if status == "success" and result is not None:
+                    yield result
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
 
 
 async def research_company_stream(
     company_name: str, role: str, session_id: str
 ) -> AsyncGenerator[dict[str, object], None]:
-    """Stream research progress and final results with timeout."""
+    """Stream research progress and final results with timeout.
+
+    Results are cached per company/role, so repeat requests skip the agents entirely.
+    """
+    cached = get_cached_research(company_name, role)
+    if cached is not None:
+        yield {"type": "status", "message": "Using cached company research"}
+        yield {"type": "complete", "data": cached.model_dump()}
+        return
+
     try:
         # Step 1: Plan searches
         yield {"type": "status", "message": "Planning research strategy..."}
         search_plan = await _plan_searches(company_name, role, session_id)
-        yield {"type": "status", "message": f"Found {len(search_plan.searches)} areas to research"}
+        searches = search_plan.searches
+        if settings.dedupe_search_queries:
+            searches = _dedupe_searches(searches)
+        yield {"type": "status", "message": f"Found {len(searches)} areas to research"}
 
         # Step 2: Execute searches, streaming progress
         search_results: list[str] = []
-        async for item in _execute_searches(search_plan.searches, session_id):
+        async for item in _execute_searches(searches, session_id):
             if isinstance(item, dict):
                 yield item
             else:
@@ -125,6 +215,7 @@ async def research_company_stream(
         # Step 3: Summarize
         yield {"type": "status", "message": "Analyzing findings..."}
         summary = await _summarize_results(company_name, role, search_results, session_id)
+        cache_research(company_name, role, summary)
         yield {"type": "complete", "data": summary.model_dump()}
 
     except InputGuardrailTripwireTriggered:
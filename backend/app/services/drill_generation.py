@@ -6,7 +6,7 @@ to select the best drill.
 """
 
 import asyncio
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Sequence
 
 from agents import Agent
 from agents.exceptions import (
@@ -42,6 +42,39 @@ ALL_GENERATORS = [
     (design_drill_agent, DrillType.SYSTEM_DESIGN, "system design problem"),
 ]
 
+# Generators used per request, fixed by configuration at import time
+SELECTED_GENERATORS: tuple[tuple[Agent[DrillCandidate], DrillType, str], ...] = tuple(
+    ALL_GENERATORS[:HOW_MANY_GENERATORS]
+)
+
+
+def _build_company_block(company_summary: CompanySummary) -> str:
+    """Format company research as the context block shared by all generators."""
+    industry = (
+        f"Industry: {company_summary.industry}\n" if company_summary.industry else ""
+    )
+    tech_stack = ""
+    if company_summary.tech_stack:
+        tech = company_summary.tech_stack
+        all_tech = tech.languages + tech.frameworks + tech.tools
+        if all_tech:
+            tech_stack = f"\nTech Stack: {', '.join(all_tech)}"
+    culture = (
+        f"\nEngineering Culture: {company_summary.engineering_culture}"
+        if company_summary.engineering_culture
+        else ""
+    )
+    tips = (
+        f"\nInterview Tips: {company_summary.interview_tips}"
+        if company_summary.interview_tips
+        else ""
+    )
+    return (
+        f"\nCompany Context:\n{industry}"
+        f"Description: {company_summary.description}"
+        f"{tech_stack}{culture}{tips}"
+    )
+
 
 def _build_generator_input(
     company_name: str,
@@ -50,38 +83,51 @@ def _build_generator_input(
     company_summary: CompanySummary | None = None,
     previous_feedback_summary: str | None = None,
 ) -> str:
-    """Build the input prompt for generator agents."""
-    parts = [
-        f"Company: {company_name}",
-        f"Role: {role}",
-    ]
+    """Build the input prompt for generator agents.
 
+    Built once per generation and shared by every generator.
+    """
     # Include full role description (up to 8000 chars)
-    if role_description:
-        parts.append(f"Role Description: {role_description}")
+    description = f"\nRole Description: {role_description}" if role_description else ""
 
     # Include company research if available
-    if company_summary:
-        parts.append("\nCompany Context:")
-        if company_summary.industry:
-            parts.append(f"Industry: {company_summary.industry}")
-        parts.append(f"Description: {company_summary.description}")
-        if company_summary.tech_stack:
-            tech = company_summary.tech_stack
-            all_tech = tech.languages + tech.frameworks + tech.tools
-            if all_tech:
-                parts.append(f"Tech Stack: {', '.join(all_tech)}")
-        if company_summary.engineering_culture:
-            parts.append(f"Engineering Culture: {company_summary.engineering_culture}")
-        if company_summary.interview_tips:
-            parts.append(f"Interview Tips: {company_summary.interview_tips}")
+    company = f"\n{_build_company_block(company_summary)}" if company_summary else ""
 
     # Include feedback from previous drill to target weak areas
-    if previous_feedback_summary:
-        parts.append("\nPrevious Drill Feedback (target these weak areas):")
-        parts.append(previous_feedback_summary)
+    feedback = (
+        "\n\nPrevious Drill Feedback (target these weak areas):\n"
+        f"{previous_feedback_summary}"
+        if previous_feedback_summary
+        else ""
+    )
+
+    return f"Company: {company_name}\nRole: {role}{description}{company}{feedback}"
 
-    return "\n".join(parts)
+
+def _format_candidate(index: int, candidate: DrillCandidate) -> str:
+    """Format one candidate as a single block for the evaluator prompt."""
+    drill = candidate.drill
+    requirements = ", ".join(drill.requirements)
+    tech_stack = ", ".join(drill.tech_stack)
+    starter_code = (
+        f"Starter Code:\n```\n{drill.starter_code}\n```\n" if drill.starter_code else ""
+    )
+    hints = f"Hints: {', '.join(drill.hints)}\n" if drill.hints else ""
+    return (
+        f"--- Candidate {index} ({candidate.generator_type.value}) ---\n"
+        f"Title: {drill.title}\n"
+        f"Type: {drill.type.value}\n"
+        f"Difficulty: {drill.difficulty.value}\n"
+        f"Description: {drill.description}\n"
+        f"Requirements: {requirements}\n"
+        f"Expected Time: {drill.expected_time_minutes} minutes\n"
+        f"Tech Stack: {tech_stack}\n"
+        f"{starter_code}"
+        f"{hints}"
+        f"Company Context: {drill.company_context or 'N/A'}\n"
+        f"Generator Reasoning: {candidate.reasoning}\n"
+        f"Generator Confidence: {candidate.confidence_score}\n"
+    )
 
 
 def _build_evaluator_input(
@@ -90,33 +136,10 @@ def _build_evaluator_input(
     candidates: list[DrillCandidate],
 ) -> str:
     """Build the input prompt for the evaluator agent."""
-    parts = [
-        f"Company: {company_name}",
-        f"Role: {role}",
-        "",
-        "CANDIDATES TO EVALUATE:",
-        "",
-    ]
-
-    for i, candidate in enumerate(candidates, 1):
-        parts.append(f"--- Candidate {i} ({candidate.generator_type.value}) ---")
-        parts.append(f"Title: {candidate.drill.title}")
-        parts.append(f"Type: {candidate.drill.type.value}")
-        parts.append(f"Difficulty: {candidate.drill.difficulty.value}")
-        parts.append(f"Description: {candidate.drill.description}")
-        parts.append(f"Requirements: {', '.join(candidate.drill.requirements)}")
-        parts.append(f"Expected Time: {candidate.drill.expected_time_minutes} minutes")
-        parts.append(f"Tech Stack: {', '.join(candidate.drill.tech_stack)}")
-        if candidate.drill.starter_code:
-            parts.append(f"Starter Code:\n```\n{candidate.drill.starter_code}\n```")
-        if candidate.drill.hints:
-            parts.append(f"Hints: {', '.join(candidate.drill.hints)}")
-        parts.append(f"Company Context: {candidate.drill.company_context or 'N/A'}")
-        parts.append(f"Generator Reasoning: {candidate.reasoning}")
-        parts.append(f"Generator Confidence: {candidate.confidence_score}")
-        parts.append("")
-
-    return "\n".join(parts)
+    header = f"Company: {company_name}\nRole: {role}\n\nCANDIDATES TO EVALUATE:\n"
+    return "\n".join(
+        [header, *(_format_candidate(i, c) for i, c in enumerate(candidates, 1))]
+    )
 
 
 async def generate_drill(
@@ -151,39 +174,35 @@ async def generate_drill(
         company_name, role, role_description, company_summary, previous_feedback_summary
     )
 
-    # Select generators based on configuration
-    generators = ALL_GENERATORS[:HOW_MANY_GENERATORS]
-
-    async def run_generator(
-        agent: Agent[DrillCandidate], drill_type: DrillType
-    ) -> DrillCandidate | None:
-        """Run a single generator with error handling."""
+    if len(SELECTED_GENERATORS) == 1:
+        # A lone generator needs no task group
+        agent, drill_type, desc = SELECTED_GENERATORS[0]
+        results = [
+            await _run_single_generator(agent, drill_type, desc, generator_input, session_id)
+        ]
+    else:
+        # Execute in parallel; a guardrail trip in any generator cancels the rest
         try:
-            output = await run_agent_streamed(
-                agent, generator_input, session_id,
-                timeout=settings.drill_generation_agent_timeout,
-            )
-            if output is None:
-                return None
-            candidate: DrillCandidate = output
-            # Ensure generator_type matches the agent
-            candidate.generator_type = drill_type
-            return candidate
-        except TimeoutError:
-            return None
-        except (InputGuardrailTripwireTriggered, OutputGuardrailTripwireTriggered):
-            raise  # Re-raise guardrail exceptions
-        except Exception:
-            return None
-
-    # Execute in parallel
-    tasks = [
-        asyncio.create_task(run_generator(agent, drill_type)) for agent, drill_type, _ in generators
-    ]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(
+                        _run_single_generator(
+                            agent, drill_type, desc, generator_input, session_id
+                        )
+                    )
+                    for agent, drill_type, desc in SELECTED_GENERATORS
+                ]
+        except ExceptionGroup as eg:
+            # _run_single_generator only lets guardrail exceptions escape
+            raise eg.exceptions[0] from None
+        results = [task.result() for task in tasks]
 
     # Filter successful candidates
-    candidates = [r for r in results if isinstance(r, DrillCandidate)]
+    candidates = [
+        result
+        for status, result, _ in results
+        if status == "success" and isinstance(result, DrillCandidate)
+    ]
 
     if not candidates:
         raise ValueError("All generators failed to produce candidates")
@@ -233,27 +252,55 @@ async def _run_single_generator(
         return ("error", str(e), desc)
 
 
-async def _run_generators_parallel(
-    generators: list[tuple[Agent[DrillCandidate], DrillType, str]],
+async def _generator_results(
+    generators: Sequence[tuple[Agent[DrillCandidate], DrillType, str]],
     generator_input: str,
     session_id: str,
-) -> AsyncGenerator[tuple[list[DrillCandidate], dict[str, object]], None]:
-    """
-    Run generators in parallel and yield (candidates, event) as they complete.
-    Final yield contains (all_candidates, None).
+) -> AsyncGenerator[tuple[str, DrillCandidate | str | None, str], None]:
+    """Yield generator results as they complete; a lone generator is awaited directly.
+
+    Uses asyncio.wait instead of as_completed so generators still running
+    when the consumer stops early are cancelled rather than orphaned.
     """
-    candidates: list[DrillCandidate] = []
+    if len(generators) == 1:
+        agent, dt, desc = generators[0]
+        yield await _run_single_generator(agent, dt, desc, generator_input, session_id)
+        return
 
-    tasks = [
+    pending = {
         asyncio.create_task(
             _run_single_generator(agent, dt, desc, generator_input, session_id)
         )
         for agent, dt, desc in generators
-    ]
+    }
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
 
-    for coro in asyncio.as_completed(tasks):
-        status, result, desc = await coro
 
+async def _run_generators_parallel(
+    generators: Sequence[tuple[Agent[DrillCandidate], DrillType, str]],
+    generator_input: str,
+    session_id: str,
+) -> AsyncGenerator[tuple[list[DrillCandidate], dict[str, object]], None]:
+    """
+    Run generators in parallel and yield (candidates, event) as they complete.
+    Final yield contains (all_candidates, None).
+    """
+    candidates: list[DrillCandidate] = []
+
+    async for status, result, desc in _generator_results(
+        generators, generator_input, session_id
+    ):
         if status == "success" and isinstance(result, DrillCandidate):
             candidate = result
             candidates.append(candidate)
@@ -330,16 +377,19 @@ async def generate_drill_stream(
             company_name, role, role_description, company_summary, previous_feedback_summary
         )
 
-        generators = ALL_GENERATORS[:HOW_MANY_GENERATORS]
-
-        yield {
-            "type": "status",
-            "message": f"Generating {len(generators)} drill candidates in parallel...",
-        }
+        if len(SELECTED_GENERATORS) == 1:
+            yield {"type": "status", "message": "Generating drill candidate..."}
+        else:
+            yield {
+                "type": "status",
+                "message": f"Generating {len(SELECTED_GENERATORS)} drill candidates in parallel...",
+            }
 
         # Phase 1: Generate candidates in parallel
         candidates: list[DrillCandidate] = []
-        gen_stream = _run_generators_parallel(generators, generator_input, session_id)
+        gen_stream = _run_generators_parallel(
+            SELECTED_GENERATORS, generator_input, session_id
+        )
         async for updated_candidates, event in gen_stream:
             candidates = updated_candidates
             yield event
@@ -350,7 +400,11 @@ async def generate_drill_stream(
             return
 
         if len(candidates) == 1:
-            yield {"type": "status", "message": "Only one candidate generated, using it directly."}
+            if len(SELECTED_GENERATORS) > 1:
+                yield {
+                    "type": "status",
+                    "message": "Only one candidate generated, using it directly.",
+                }
             yield {"type": "complete", "data": candidates[0].drill.model_dump()}
             return
 
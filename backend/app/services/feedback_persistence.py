@@ -2,7 +2,9 @@
 Feedback persistence service for saving evaluation results as markdown files.
 """
 
+import asyncio
 import re
+import string
 from datetime import datetime
 from pathlib import Path
 
@@ -11,13 +13,71 @@ from app.schemas.evaluation import SolutionFeedback
 # Base directory for feedback files (relative to project root)
 FEEDBACKS_BASE_DIR = Path("docs/drills/feedbacks")
 
+_UNSAFE_CHAR_RE = re.compile(r"[^\w\-]")
+_UNDERSCORES_RE = re.compile(r"_+")
+
+# ASCII fast path: maps every ASCII char outside [A-Za-z0-9_-] to "_"
+_ASCII_SAFE_CHARS = set(string.ascii_letters + string.digits + "_-")
+_ASCII_TRANSLATION = str.maketrans(
+    {chr(c): "_" for c in range(128) if chr(c) not in _ASCII_SAFE_CHARS}
+)
+
+
+# Markdown section templates, assembled by format_feedback_markdown
+_HEADER_TEMPLATE = """\
+# Feedback: {drill_title}
+
+**Company:** {company_name}
+**Role:** {role}
+**Date:** {date}
+**Score:** {score}/10 ({score_indicator})
+
+---
+
+## Strengths
+
+"""
+_STRENGTH_TEMPLATE = """\
+### {title}
+
+{description}
+
+"""
+_NO_STRENGTHS = "_No specific strengths noted._\n\n"
+_IMPROVEMENTS_HEADING = """\
+---
+
+## Areas for Improvement
+
+"""
+_IMPROVEMENT_TEMPLATE = """\
+### {title}
+
+{description}
+
+**Suggestion:** {suggestion}
+
+"""
+_NO_IMPROVEMENTS = "_No specific improvements noted._\n\n"
+_SUMMARY_TEMPLATE = """\
+---
+
+## Summary for Next Practice
+
+{summary}
+"""
+
 
 def sanitize_filename(name: str) -> str:
     """Sanitize a string for use in filenames."""
+    lowered = name.lower()
     # Replace spaces and special chars with underscores
-    sanitized = re.sub(r"[^\w\-]", "_", name.lower())
+    if lowered.isascii():
+        sanitized = lowered.translate(_ASCII_TRANSLATION)
+    else:
+        sanitized = _UNSAFE_CHAR_RE.sub("_", lowered)
     # Collapse multiple underscores
-    sanitized = re.sub(r"_+", "_", sanitized)
+    sanitized = _UNDERSCORES_RE.sub("_", sanitized)
     # Remove leading/trailing underscores
     return sanitized.strip("_")
 
@@ -55,29 +115,44 @@ def generate_feedback_path(
     return FEEDBACKS_BASE_DIR / timestamp_dir / filename
 
 
-def resolve_duplicate_path(base_path: Path) -> Path:
+def _has_content(path: Path, data: bytes) -> bool:
+    """Check whether path holds exactly data, rejecting on size before reading."""
+    try:
+        return path.stat().st_size == len(data) and path.read_bytes() == data
+    except OSError:
+        return False
+
+
+def write_unique_file(base_path: Path, content: str) -> Path:
     """
-    If the file already exists, add a numeric suffix.
+    Write content to base_path, adding a numeric suffix if the file already exists.
+
+    Files are opened in exclusive-create mode, so a name is claimed atomically
+    and concurrent saves can never overwrite each other. If an existing file
+    already holds identical content (e.g. a retried request), it is reused.
 
     Args:
-        base_path: The original file path
+        base_path: The preferred file path
+        content: Text to write
 
     Returns:
-        A unique path (may have _1, _2, etc. suffix)
+        The path actually written or reused (may have _1, _2, etc. suffix)
     """
-    if not base_path.exists():
-        return base_path
+    base_path.parent.mkdir(parents=True, exist_ok=True)
+    data = content.encode("utf-8")
 
-    stem = base_path.stem
-    suffix = base_path.suffix
-    parent = base_path.parent
-
-    counter = 1
+    path = base_path
+    counter = 0
     while True:
-        new_path = parent / f"{stem}_{counter}{suffix}"
-        if not new_path.exists():
-            return new_path
-        counter += 1
+        try:
+            with path.open("xb") as f:
+                f.write(data)
+            return path
+        except FileExistsError:
+            if _has_content(path, data):
+                return path
+            counter += 1
+            path = base_path.with_name(f"{base_path.stem}_{counter}{base_path.suffix}")
 
 
 def format_feedback_markdown(
@@ -111,70 +186,35 @@ def format_feedback_markdown(
     else:
         score_indicator = "Needs Improvement"
 
-    lines = [
-        f"# Feedback: {drill_title}",
-        "",
-        f"**Company:** {company_name}",
-        f"**Role:** {role}",
-        f"**Date:** {timestamp.strftime('%Y-%m-%d %H:%M')}",
-        f"**Score:** {feedback.score}/10 ({score_indicator})",
-        "",
-        "---",
-        "",
-        "## Strengths",
-        "",
-    ]
-
-    for strength in feedback.strengths:
-        lines.extend(
-            [
-                f"### {strength.title}",
-                "",
-                strength.description,
-                "",
-            ]
+    header = _HEADER_TEMPLATE.format(
+        drill_title=drill_title,
+        company_name=company_name,
+        role=role,
+        date=timestamp.strftime("%Y-%m-%d %H:%M"),
+        score=feedback.score,
+        score_indicator=score_indicator,
+    )
+    strengths = "".join(
+        _STRENGTH_TEMPLATE.format(title=s.title, description=s.description)
+        for s in feedback.strengths
+    )
+    improvements = "".join(
+        _IMPROVEMENT_TEMPLATE.format(
+            title=i.title, description=i.description, suggestion=i.suggestion
         )
-
-    if not feedback.strengths:
-        lines.append("_No specific strengths noted._\n")
-
-    lines.extend(
-        [
-            "---",
-            "",
-            "## Areas for Improvement",
-            "",
-        ]
+        for i in feedback.improvements
     )
 
-    for improvement in feedback.improvements:
-        lines.extend(
-            [
-                f"### {improvement.title}",
-                "",
-                improvement.description,
-                "",
-                f"**Suggestion:** {improvement.suggestion}",
-                "",
-            ]
+    return "".join(
+        (
+            header,
+            strengths or _NO_STRENGTHS,
+            _IMPROVEMENTS_HEADING,
+            improvements or _NO_IMPROVEMENTS,
+            _SUMMARY_TEMPLATE.format(summary=feedback.summary_for_next_drill),
         )
-
-    if not feedback.improvements:
-        lines.append("_No specific improvements noted._\n")
-
-    lines.extend(
-        [
-            "---",
-            "",
-            "## Summary for Next Practice",
-            "",
-            feedback.summary_for_next_drill,
-            "",
-        ]
     )
 
-    return "\n".join(lines)
-
 
 def save_feedback(
     feedback: SolutionFeedback,
@@ -203,19 +243,26 @@ def save_feedback(
 
     # Generate path
     relative_path = generate_feedback_path(company_name, role, timestamp)
-    absolute_path = project_root / relative_path
-
-    # Handle duplicates
-    absolute_path = resolve_duplicate_path(absolute_path)
-
-    # Create directories
-    absolute_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Format content
     content = format_feedback_markdown(feedback, company_name, role, drill_title, timestamp)
 
-    # Write file
-    absolute_path.write_text(content, encoding="utf-8")
+    # Write file, resolving duplicates
+    absolute_path = write_unique_file(project_root / relative_path, content)
 
     # Return path relative to project root
     return absolute_path.relative_to(project_root)
+
+
+async def save_feedback_async(
+    feedback: SolutionFeedback,
+    company_name: str,
+    role: str,
+    drill_title: str,
+    project_root: Path | None = None,
+) -> Path:
+    """Save feedback without blocking the event loop (runs save_feedback in a thread)."""
+    return await asyncio.to_thread(
+        save_feedback, feedback, company_name, role, drill_title, project_root
+    )
+
@@ -2,7 +2,12 @@
 
 import asyncio
 import random
-import re
+import string
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from functools import cache
 from typing import Any
 
 import httpx
@@ -10,14 +15,22 @@ import httpx
 from app.config import settings
 from app.schemas.scout import RepoMetadata, SearchFilters
 
-_VALID_NAME_RE = re.compile(r"^[a-zA-Z0-9._-]+$")
+# Deletes every allowed name character; anything left over is invalid
+_NAME_CHARS_TABLE = str.maketrans("", "", string.ascii_letters + string.digits + "._-")
 
 GRAPHQL_URL = "https://api.github.com/graphql"
 RATE_LIMIT_THRESHOLD = 100
 MAX_RETRIES = 3
-RETRY_DELAYS = [1.0, 2.0, 4.0]
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 10.0
+MAX_RATE_LIMIT_WAIT = 60.0  # Longer server-requested waits fail fast instead
 README_BATCH_SIZE = 20
 README_MAX_CHARS = 16000
+README_FORMAT_VERSION = 2  # Bump when README truncation changes; cached text is refetched
+README_CONCURRENCY = 5
+README_WORD_BOUNDARY_WINDOW = 200  # Max chars given up to end on whitespace
+HTTP_TIMEOUT = 30.0
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
 
 SEARCH_QUERY = """
 query SearchRepos($query: String!, $first: Int!, $after: String) {
@@ -52,54 +65,123 @@ query SearchRepos($query: String!, $first: Int!, $after: String) {
 """
 
 
+@dataclass
+class RateLimitBudget:
+    """GraphQL point budget shared by every request made through one client.
+
+    Updated from the ``rateLimit`` block of each response and consulted
+    before each request, so concurrent README batches and search pages back
+    off together instead of each discovering the exhaustion on its own.
+    """
+
+    remaining: int | None = None
+    reset_at: datetime | None = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    def update(self, rate_limit: dict[str, Any]) -> None:
+        self.remaining = rate_limit.get("remaining", self.remaining)
+        reset_at = rate_limit.get("resetAt")
+        if reset_at:
+            self.reset_at = datetime.fromisoformat(reset_at)
+
+    def is_low(self) -> bool:
+        return self.remaining is not None and self.remaining < RATE_LIMIT_THRESHOLD
+
+    def seconds_until_reset(self) -> float:
+        if self.reset_at is None:
+            return float("inf")
+        return max(0.0, (self.reset_at - datetime.now(UTC)).total_seconds())
+
+    async def wait_if_low(self) -> None:
+        """Sleep until the budget resets when it is low and the reset is near.
+
+        Resets further away than MAX_RATE_LIMIT_WAIT are not waited out;
+        the request goes ahead and the 403 handling decides what happens.
+        """
+        async with self.lock:
+            if not self.is_low():
+                return
+            delay = self.seconds_until_reset()
+            if delay > MAX_RATE_LIMIT_WAIT:
+                return
+            await asyncio.sleep(delay)
+            self.remaining = None
+
+
 class GitHubGraphQLClient:
     GRAPHQL_URL = GRAPHQL_URL
     RATE_LIMIT_THRESHOLD = RATE_LIMIT_THRESHOLD
     MAX_RETRIES = MAX_RETRIES
-    RETRY_DELAYS = RETRY_DELAYS
+    RETRY_BASE_DELAY = RETRY_BASE_DELAY
+    RETRY_MAX_DELAY = RETRY_MAX_DELAY
+    MAX_RATE_LIMIT_WAIT = MAX_RATE_LIMIT_WAIT
     README_BATCH_SIZE = README_BATCH_SIZE
     README_MAX_CHARS = README_MAX_CHARS
+    README_CONCURRENCY = README_CONCURRENCY
 
     def __init__(self, token: str) -> None:
         if not token:
             raise ValueError("GITHUB_TOKEN is not configured — token is required")
         self.token = token
+        # One pooled client per instance so search pages and README batches
+        # reuse the same TLS connections instead of handshaking per request
+        self._http = httpx.AsyncClient(
+            timeout=HTTP_TIMEOUT,
+            limits=HTTP_LIMITS,
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json",
+            },
+        )
+        self._budget = RateLimitBudget()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections."""
+        await self._http.aclose()
 
     async def _execute_query(
         self, query: str, variables: dict[str, object] | None = None
     ) -> dict[str, Any]:
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json",
-        }
         payload: dict[str, object] = {"query": query}
         if variables:
             payload["variables"] = variables
 
-        response = await self._retry_request(payload, headers)
+        await self._budget.wait_if_low()
+        response = await self._retry_request(payload)
         data = response.json()
         if data.get("data") is None and "errors" in data:
             messages = [e.get("message", str(e)) for e in data["errors"]]
             raise ValueError(f"GraphQL errors: {'; '.join(messages)}")
         result: dict[str, Any] = data.get("data", data)
+        if rate_limit := result.get("rateLimit"):
+            self._budget.update(rate_limit)
         return result
 
-    async def _retry_request(
-        self,
-        payload: dict[str, object],
-        headers: dict[str, str],
-    ) -> httpx.Response:
-        """Execute an HTTP POST with retry for 502/503 errors."""
+    async def _retry_request(self, payload: dict[str, object]) -> httpx.Response:
+        """Execute an HTTP POST with retry for 502/503 errors.
+
+        403/429 rate-limit responses are retried after exactly the wait GitHub
+        asks for (Retry-After or X-RateLimit-Reset), if it is short enough.
+        """
         last_exc: Exception | None = None
+        delay = self.RETRY_BASE_DELAY
         for attempt in range(self.MAX_RETRIES):
-            async with httpx.AsyncClient(timeout=30.0) as http:
-                response = await http.post(
-                    self.GRAPHQL_URL, json=payload, headers=headers
-                )
+            response = await self._http.post(self.GRAPHQL_URL, json=payload)
 
             if response.status_code == 401:
                 response.raise_for_status()
 
+            if response.status_code in (403, 429):
+                wait = _rate_limit_delay(response)
+                if (
+                    wait is not None
+                    and wait <= self.MAX_RATE_LIMIT_WAIT
+                    and attempt < self.MAX_RETRIES - 1
+                ):
+                    await asyncio.sleep(wait)
+                    continue
+                response.raise_for_status()
+
             if response.status_code in (502, 503):
                 last_exc = httpx.HTTPStatusError(
                     f"Server error {response.status_code}",
@@ -107,7 +189,7 @@ class GitHubGraphQLClient:
                     response=response,
                 )
                 if attempt < self.MAX_RETRIES - 1:
-                    await _sleep_with_jitter(self.RETRY_DELAYS[attempt])
+                    delay = await _sleep_with_jitter(delay, self.RETRY_MAX_DELAY)
                     continue
                 raise last_exc
 
@@ -133,6 +215,9 @@ class GitHubGraphQLClient:
                 "after": cursor,
             }
             data = await self._execute_query(SEARCH_QUERY, variables)
+            if cursor is None:
+                # repositoryCount is the same on every page; check it once
+                _warn_if_incomplete(warnings, data["search"]["repositoryCount"])
             cursor = self._process_search_page(data, repos, warnings, max_total)
             if cursor is None:
                 break
@@ -147,15 +232,19 @@ class GitHubGraphQLClient:
         max_total: int,
     ) -> str | None:
         search = data["search"]
-        _warn_if_incomplete(warnings, search["repositoryCount"])
 
         for edge in search["edges"]:
-            if edge["node"] is None:
+            node = edge["node"]
+            # databaseId is nullable and _parse_repo_node skips validation,
+            # so a node without one would reach the INTEGER PRIMARY KEY as NULL
+            if node is None or node.get("databaseId") is None:
                 continue
-            repos.append(_parse_repo_node(edge["node"]))
+            repos.append(_parse_repo_node(node))
 
-        rate_remaining = data.get("rateLimit", {}).get("remaining", 5000)
-        if rate_remaining < self.RATE_LIMIT_THRESHOLD:
+        # A near reset is waited out before the next page; only a distant
+        # one ends pagination early
+        budget = self._budget
+        if budget.is_low() and budget.seconds_until_reset() > self.MAX_RATE_LIMIT_WAIT:
             warnings.append(
                 "GitHub rate limit approaching. Returning partial results."
             )
@@ -172,33 +261,61 @@ class GitHubGraphQLClient:
         self, repos: list[tuple[str, str]]
     ) -> dict[str, str | None]:
         for owner, name in repos:
-            if not _VALID_NAME_RE.match(owner) or not _VALID_NAME_RE.match(name):
+            if not _is_valid_name(owner) or not _is_valid_name(name):
                 raise ValueError(
                     f"Repository '{owner}/{name}' contains invalid characters"
                 )
 
+        # Batches are independent, so fetch them concurrently (bounded)
+        semaphore = asyncio.Semaphore(self.README_CONCURRENCY)
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(
+                        self._fetch_readme_batch(
+                            repos[batch_start : batch_start + self.README_BATCH_SIZE],
+                            semaphore,
+                        )
+                    )
+                    for batch_start in range(0, len(repos), self.README_BATCH_SIZE)
+                ]
+        except ExceptionGroup as eg:
+            # Surface the first failure as before; the other batches are cancelled
+            raise eg.exceptions[0] from None
+
         result: dict[str, str | None] = {}
-        for batch_start in range(0, len(repos), self.README_BATCH_SIZE):
-            batch = repos[batch_start : batch_start + self.README_BATCH_SIZE]
-            query = _build_readme_query(batch, batch_start)
-            data = await self._execute_query(query)
-
-            for i, (owner, name) in enumerate(batch):
-                alias = f"repo_{batch_start + i}"
-                repo_data = data.get(alias)
-                if repo_data and repo_data.get("object"):
-                    text = repo_data["object"].get("text")
-                    if text and len(text) > self.README_MAX_CHARS:
-                        text = text[: self.README_MAX_CHARS]
-                    result[f"{owner}/{name}"] = text
-                else:
-                    result[f"{owner}/{name}"] = None
+        for task in tasks:
+            result.update(task.result())
+        return result
+
+    async def _fetch_readme_batch(
+        self,
+        batch: list[tuple[str, str]],
+        semaphore: asyncio.Semaphore,
+    ) -> dict[str, str | None]:
+        query = _build_readme_query(len(batch))
+        async with semaphore:
+            data = await self._execute_query(query, _readme_variables(batch))
+
+        result: dict[str, str | None] = {}
+        for i, (owner, name) in enumerate(batch):
+            alias = f"repo_{i}"
+            repo_data = data.get(alias)
+            if repo_data and repo_data.get("object"):
+                text = repo_data["object"].get("text")
+                result[f"{owner}/{name}"] = text and _truncate_readme(
+                    text, self.README_MAX_CHARS
+                )
+            else:
+                result[f"{owner}/{name}"] = None
 
         return result
 
 
 def _parse_repo_node(node: dict[str, Any]) -> RepoMetadata:
-    return RepoMetadata(
+    # GraphQL responses match the schema types exactly, so skip per-field
+    # validation for the few hundred nodes of every search
+    return RepoMetadata.model_construct(
         github_id=node["databaseId"],
         owner=node["owner"]["login"],
         name=node["name"],
@@ -224,52 +341,103 @@ def _parse_repo_node(node: dict[str, Any]) -> RepoMetadata:
 
 
 def _build_search_query_string(filters: SearchFilters) -> str:
-    parts: list[str] = []
-
-    for lang in filters.languages:
-        parts.append(f"language:{lang}")
+    return " ".join(_search_qualifiers(filters))
 
-    parts.append(f"stars:{filters.min_stars}..{filters.max_stars}")
 
+def _search_qualifiers(filters: SearchFilters) -> Iterator[str]:
+    """Yield the GitHub search qualifiers for the given filters, in order."""
+    for lang in filters.languages:
+        yield f"language:{lang}"
+    yield f"stars:{filters.min_stars}..{filters.max_stars}"
     if filters.min_activity_date:
-        parts.append(f"pushed:>={filters.min_activity_date}")
-
+        yield f"pushed:>={filters.min_activity_date}"
     for topic in filters.topics:
-        parts.append(f"topic:{topic}")
-
+        yield f"topic:{topic}"
     if filters.license:
-        parts.append(f"license:{filters.license}")
+        yield f"license:{filters.license}"
+    yield "archived:false"
+    yield "fork:false"
+
+
+_README_SLOT_TEMPLATE = (
+    "repo_{i}: repository(owner: $o{i}, name: $n{i}) "
+    '{{ object(expression: "HEAD:README.md") {{ ... on Blob {{ text }} }} }}'
+)
 
-    parts.append("archived:false")
-    parts.append("fork:false")
 
-    return " ".join(parts)
+@cache
+def _build_readme_query(size: int) -> str:
+    """README query for a batch of `size` repos, with owner/name as variables.
 
+    The text depends only on the batch size, so it is built once per size and
+    GitHub sees an identical query document for every full batch.
+    """
+    params = ", ".join(f"$o{i}: String!, $n{i}: String!" for i in range(size))
+    slots = " ".join(_README_SLOT_TEMPLATE.format(i=i) for i in range(size))
+    return f"query({params}) {{ {slots} rateLimit {{ remaining resetAt }} }}"
 
-def _build_readme_query(repos: list[tuple[str, str]], offset: int = 0) -> str:
-    parts: list[str] = []
+
+def _readme_variables(repos: list[tuple[str, str]]) -> dict[str, object]:
+    variables: dict[str, object] = {}
     for i, (owner, name) in enumerate(repos):
-        alias = f"repo_{offset + i}"
-        parts.append(
-            f'{alias}: repository(owner: "{owner}", name: "{name}") '
-            f'{{ object(expression: "HEAD:README.md") {{ ... on Blob {{ text }} }} }}'
-        )
-    return "query { " + " ".join(parts) + " rateLimit { remaining resetAt } }"
+        variables[f"o{i}"] = owner
+        variables[f"n{i}"] = name
+    return variables
+
+
+def _is_valid_name(value: str) -> bool:
+    """Check a GitHub owner/repo name is non-empty and only [A-Za-z0-9._-]."""
+    return bool(value) and not value.translate(_NAME_CHARS_TABLE)
+
+
+def _truncate_readme(text: str, limit: int) -> str:
+    """Cut an oversized README at limit, backing off to nearby whitespace.
+
+    Ending on a word boundary keeps a half word from wasting prompt tokens,
+    but only whitespace within README_WORD_BOUNDARY_WINDOW of the limit is
+    used, so a long unbroken blob (base64, minified code) is still cut at
+    about limit rather than back at its last preceding line break.
+    """
+    if len(text) <= limit:
+        return text
+    # A space right at the limit counts, so search one character past it
+    start = max(limit - README_WORD_BOUNDARY_WINDOW, 0)
+    cut = max(text.rfind(" ", start, limit + 1), text.rfind("\n", start, limit + 1))
+    return text[:cut] if cut > 0 else text[:limit]
 
 
 def _warn_if_incomplete(warnings: list[str], repo_count: int) -> None:
     """Append a warning if GitHub's 1,000-result cap may truncate results."""
-    if repo_count >= 1000 and not any("incomplete" in w.lower() for w in warnings):
+    if repo_count >= 1000:
         warnings.append(
             "Results may be incomplete (GitHub caps at 1,000). "
             "Try narrowing your filters."
         )
 
 
-async def _sleep_with_jitter(delay: float) -> None:
-    """Add random jitter to prevent thundering herd on concurrent retries."""
-    jitter = random.uniform(0, delay * 0.5)
-    await asyncio.sleep(delay + jitter)
+def _rate_limit_delay(response: httpx.Response) -> float | None:
+    """Seconds GitHub asks us to wait before retrying, or None if it doesn't say."""
+    try:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            return max(float(retry_after), 0.0)
+        reset = response.headers.get("X-RateLimit-Reset")
+        if response.headers.get("X-RateLimit-Remaining") == "0" and reset is not None:
+            return max(float(reset) - time.time(), 0.0)
+    except ValueError:
+        pass  # Malformed header, treat as unspecified
+    return None
+
+
+async def _sleep_with_jitter(prev: float, cap: float) -> float:
+    """Sleep for a decorrelated-jitter backoff and return the delay used.
+
+    Each delay is drawn from [RETRY_BASE_DELAY, 3 * prev] and capped, so
+    concurrent retries spread out instead of waking in lockstep.
+    """
+    delay = min(cap, random.uniform(RETRY_BASE_DELAY, prev * 3))
+    await asyncio.sleep(delay)
+    return delay
 
 
 def create_github_client() -> GitHubGraphQLClient:
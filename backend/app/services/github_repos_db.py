@@ -1,12 +1,14 @@
 """SQLite persistence layer for GitHub Scout feature."""
 
+import asyncio
+import hashlib
 import json
 import uuid
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Sequence
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime, timedelta
-from functools import cache
 from pathlib import Path
+from typing import Any
 
 import aiosqlite
 
@@ -18,53 +20,106 @@ from app.schemas.scout import (
     SearchFilters,
     SearchRunResponse,
 )
+from app.services.github_client import README_FORMAT_VERSION
 
 _QUERIES_DIR = Path(__file__).parent / "queries"
+_README_CACHE_TTL = timedelta(days=30)
+_ANALYSIS_CACHE_TTL = timedelta(days=30)
+
+# Read every query at import so no request pays a blocking file read
+_SQL: dict[str, str] = {
+    path.stem: path.read_text().strip() for path in _QUERIES_DIR.glob("*.sql")
+}
 
 _DDL_KEYS = [
     "create_search_runs",
     "create_repositories",
+    "create_repositories_owner_name_index",
     "create_analysis_results",
+    "create_analysis_results_run_id_index",
+    "create_analysis_results_github_id_index",
+    "create_readme_cache",
+    "create_analysis_cache",
 ]
 
+# Applied once when the shared connection opens. Scout data is a re-fetchable
+# cache, so synchronous=NORMAL (no fsync per commit under WAL) is safe.
+_CONNECTION_PRAGMAS = [
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",  # 64 MiB page cache
+    "PRAGMA mmap_size=268435456",  # 256 MiB memory-mapped reads
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA wal_autocheckpoint=1000",
+]
 
-@cache
-def _sql(name: str) -> str:
-    return (_QUERIES_DIR / f"{name}.sql").read_text().strip()
 
+def _json_list(value: str | None) -> list[str]:
+    return json.loads(value) if value else []
 
-def _row_to_analysis_result(row: aiosqlite.Row) -> AnalysisResult:
-    """Convert a get_analysis_with_repos row to AnalysisResult."""
-    return AnalysisResult(
-        repo=f"{row[6]}/{row[7]}",
-        fit_score=row[0],
-        reason=row[1],
-        contributions=json.loads(row[2]) if row[2] else [],
-        reject=bool(row[3]),
-        reject_reason=row[4],
-    )
 
+def _row_to_result_and_repo(row: Sequence[Any]) -> tuple[AnalysisResult, RepoMetadata]:
+    """Convert the analysis and repo columns of a get_search_results row.
 
-def _row_to_repo_metadata(row: aiosqlite.Row) -> RepoMetadata:
-    """Convert a get_analysis_with_repos row to RepoMetadata."""
-    return RepoMetadata(
-        github_id=row[5],
-        owner=row[6],
-        name=row[7],
-        url=row[8],
-        description=row[9],
-        primary_language=row[10],
-        languages=json.loads(row[11]) if row[11] else [],
-        star_count=row[12],
-        fork_count=row[13],
-        open_issue_count=row[14],
-        topics=json.loads(row[15]) if row[15] else [],
-        license=row[16],
-        pushed_at=row[17],
-        created_at=row[18],
-        good_first_issue_count=row[19],
-        help_wanted_count=row[20],
+    Rows were validated before they were written, so both models are built
+    with model_construct instead of being validated again field by field.
+    """
+    (
+        fit_score, reason, contributions, reject, reject_reason,
+        github_id, owner, name, url, description, primary_language,
+        languages, star_count, fork_count, open_issue_count, topics, license_,
+        pushed_at, created_at, good_first_issue_count, help_wanted_count,
+    ) = row
+    result = AnalysisResult.model_construct(
+        repo=f"{owner}/{name}",
+        fit_score=fit_score,
+        reason=reason,
+        contributions=_json_list(contributions),
+        reject=bool(reject),
+        reject_reason=reject_reason,
     )
+    repo = RepoMetadata.model_construct(
+        github_id=github_id,
+        owner=owner,
+        name=name,
+        url=url,
+        description=description,
+        primary_language=primary_language,
+        languages=_json_list(languages),
+        star_count=star_count,
+        fork_count=fork_count,
+        open_issue_count=open_issue_count,
+        topics=_json_list(topics),
+        license=license_,
+        pushed_at=pushed_at,
+        created_at=created_at,
+        good_first_issue_count=good_first_issue_count,
+        help_wanted_count=help_wanted_count,
+    )
+    return result, repo
+
+
+def _analysis_profile(filters: SearchFilters) -> str:
+    """Hash the filter fields that reach the analysis prompt.
+
+    Star range, license and activity date only decide which repos are
+    analyzed, not how, so searches differing only there share entries.
+    """
+    payload = json.dumps([filters.languages, filters.topics, filters.query])
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+async def _drop_unversioned_readme_cache(db: aiosqlite.Connection) -> None:
+    """Drop a readme_cache table created before entries carried a format version.
+
+    It only holds re-fetchable READMEs, so dropping it is cheaper than a
+    migration; the DDL recreates it with the version column.
+    """
+    cursor = await db.execute("PRAGMA table_info(readme_cache)")
+    columns = {row[1] for row in await cursor.fetchall()}
+    if columns and "version" not in columns:
+        await db.execute("DROP TABLE readme_cache")
 
 
 class GitHubReposDB:
@@ -73,21 +128,51 @@ class GitHubReposDB:
     def __init__(self, db_path: str) -> None:
         self.db_path = db_path
         self._initialized = False
+        self._db: aiosqlite.Connection | None = None
+        # Guards the shared connection: one operation at a time, so a reader
+        # never runs inside another coroutine's open write transaction
+        self._lock = asyncio.Lock()
 
     @asynccontextmanager
     async def _connect(self) -> AsyncIterator[aiosqlite.Connection]:
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("PRAGMA journal_mode=WAL")
-            await db.execute("PRAGMA foreign_keys=ON")
-            yield db
+        """Yield the shared connection, opening it on first use."""
+        async with self._lock:
+            if self._db is None:
+                db = await aiosqlite.connect(self.db_path)
+                for pragma in _CONNECTION_PRAGMAS:
+                    await db.execute(pragma)
+                self._db = db
+            yield self._db
+
+    @asynccontextmanager
+    async def _write(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Yield the shared connection for a write transaction.
+
+        A failed write is rolled back so its partial transaction is never
+        committed by the next operation on the shared connection.
+        """
+        async with self._connect() as db:
+            try:
+                yield db
+            except BaseException:
+                await db.rollback()
+                raise
+
+    async def close(self) -> None:
+        """Close the shared connection (it reopens on next use)."""
+        async with self._lock:
+            if self._db is not None:
+                await self._db.close()
+                self._db = None
 
     async def _ensure_init(self) -> None:
         if self._initialized:
             return
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
-        async with self._connect() as db:
+        async with self._write() as db:
+            await _drop_unversioned_readme_cache(db)
             for key in _DDL_KEYS:
-                await db.execute(_sql(key))
+                await db.execute(_SQL[key])
             await db.commit()
         self._initialized = True
         await self.prune_stale_repos()
@@ -98,12 +183,12 @@ class GitHubReposDB:
         await self._ensure_init()
         run_id = str(uuid.uuid4())
         now = datetime.now(tz=UTC).isoformat()
-        async with self._connect() as db:
+        async with self._write() as db:
             await db.execute(
-                _sql("insert_search_run"),
+                _SQL["insert_search_run"],
                 (
                     run_id,
-                    json.dumps(filters.model_dump()),
+                    filters.model_dump_json(),
                     "running",
                     now,
                 ),
@@ -121,9 +206,9 @@ class GitHubReposDB:
     ) -> None:
         await self._ensure_init()
         now = datetime.now(tz=UTC).isoformat()
-        async with self._connect() as db:
+        async with self._write() as db:
             await db.execute(
-                _sql("update_search_run"),
+                _SQL["update_search_run"],
                 (
                     status,
                     now,
@@ -141,7 +226,7 @@ class GitHubReposDB:
         await self._ensure_init()
         async with self._connect() as db:
             cursor = await db.execute(
-                _sql("get_search_run"),
+                _SQL["get_search_run"],
                 (run_id,),
             )
             row = await cursor.fetchone()
@@ -155,13 +240,13 @@ class GitHubReposDB:
         await self._ensure_init()
         async with self._connect() as db:
             cursor = await db.execute(
-                _sql("get_search_run_filters"),
+                _SQL["get_search_run_filters"],
                 (run_id,),
             )
             row = await cursor.fetchone()
         if row is None:
             return None
-        return SearchFilters(**json.loads(row[0]))
+        return SearchFilters.model_validate_json(row[0])
 
     async def upsert_repositories(
         self, repos: list[RepoMetadata]
@@ -192,8 +277,11 @@ class GitHubReposDB:
             )
             for repo in repos
         ]
-        async with self._connect() as db:
-            await db.executemany(_sql("upsert_repository"), params)
+        async with self._write() as db:
+            # Take the write lock up front so the batch never fails mid-way
+            # upgrading a read transaction while a concurrent run writes
+            await db.execute("BEGIN IMMEDIATE")
+            await db.executemany(_SQL["upsert_repository"], params)
             await db.commit()
 
     async def save_analysis_results(
@@ -217,9 +305,142 @@ class GitHubReposDB:
                 owner,
                 name,
             ))
-        async with self._connect() as db:
+        async with self._write() as db:
+            await db.execute("BEGIN IMMEDIATE")
             await db.executemany(
-                _sql("insert_analysis_with_lookup"), params
+                _SQL["insert_analysis_with_lookup"], params
+            )
+            await db.commit()
+
+    async def get_cached_readmes(
+        self, repos: list[RepoMetadata]
+    ) -> dict[str, str | None]:
+        """Return cached READMEs keyed by "owner/name" for unchanged repos.
+
+        A repo hits only when its current pushed_at matches the cached one;
+        a cached None means the repo had no README at that push.
+        """
+        await self._ensure_init()
+        keys = [
+            [repo.owner, repo.name, repo.pushed_at]
+            for repo in repos
+            if repo.pushed_at
+        ]
+        if not keys:
+            return {}
+        async with self._connect() as db:
+            cursor = await db.execute(
+                _SQL["get_cached_readmes"], (json.dumps(keys), README_FORMAT_VERSION)
+            )
+            rows = await cursor.fetchall()
+        return {f"{owner}/{name}": text for owner, name, text in rows}
+
+    async def save_readmes(
+        self, repos: list[RepoMetadata], readmes: dict[str, str | None]
+    ) -> None:
+        """Cache fetched READMEs under each repo's current pushed_at.
+
+        Entries older than the cache TTL are dropped in the same
+        transaction, so a long-running server keeps the table bounded.
+        """
+        await self._ensure_init()
+        now = datetime.now(tz=UTC)
+        params = [
+            (
+                repo.owner,
+                repo.name,
+                repo.pushed_at,
+                README_FORMAT_VERSION,
+                readmes[key],
+                now.isoformat(),
+            )
+            for repo in repos
+            if repo.pushed_at and (key := f"{repo.owner}/{repo.name}") in readmes
+        ]
+        if not params:
+            return
+        async with self._write() as db:
+            await db.execute("BEGIN IMMEDIATE")
+            await db.executemany(_SQL["upsert_readme_cache"], params)
+            await db.execute(
+                _SQL["prune_readme_cache"],
+                ((now - _README_CACHE_TTL).isoformat(),),
+            )
+            await db.commit()
+
+    async def get_cached_analyses(
+        self, filters: SearchFilters, repos: list[RepoMetadata]
+    ) -> dict[int, AnalysisResult]:
+        """Return cached analyses keyed by github_id for unchanged repos.
+
+        A repo hits only when it was analyzed for the same search profile
+        at its current pushed_at. The repo field is rebuilt from the current
+        owner/name so a renamed repo still matches its metadata.
+        """
+        await self._ensure_init()
+        by_id = {repo.github_id: repo for repo in repos if repo.pushed_at}
+        if not by_id:
+            return {}
+        keys = [[repo.github_id, repo.pushed_at] for repo in by_id.values()]
+        async with self._connect() as db:
+            cursor = await db.execute(
+                _SQL["get_cached_analyses"],
+                (json.dumps(keys), _analysis_profile(filters)),
+            )
+            rows = await cursor.fetchall()
+        cached: dict[int, AnalysisResult] = {}
+        for github_id, fit_score, reason, contributions, reject, reject_reason in rows:
+            repo = by_id[github_id]
+            cached[github_id] = AnalysisResult.model_construct(
+                repo=f"{repo.owner}/{repo.name}",
+                fit_score=fit_score,
+                reason=reason,
+                contributions=_json_list(contributions),
+                reject=bool(reject),
+                reject_reason=reject_reason,
+            )
+        return cached
+
+    async def save_analyses(
+        self,
+        filters: SearchFilters,
+        repos: list[RepoMetadata],
+        results: list[AnalysisResult],
+    ) -> None:
+        """Cache analysis results under each repo's current pushed_at.
+
+        Results naming a repo outside repos are skipped. Entries older than
+        the cache TTL are dropped in the same transaction.
+        """
+        await self._ensure_init()
+        by_name = {
+            f"{repo.owner}/{repo.name}": repo for repo in repos if repo.pushed_at
+        }
+        profile = _analysis_profile(filters)
+        now = datetime.now(tz=UTC)
+        params = [
+            (
+                profile,
+                repo.github_id,
+                repo.pushed_at,
+                result.fit_score,
+                result.reason,
+                json.dumps(result.contributions),
+                1 if result.reject else 0,
+                result.reject_reason,
+                now.isoformat(),
+            )
+            for result in results
+            if (repo := by_name.get(result.repo)) is not None
+        ]
+        if not params:
+            return
+        async with self._write() as db:
+            await db.execute("BEGIN IMMEDIATE")
+            await db.executemany(_SQL["upsert_analysis_cache"], params)
+            await db.execute(
+                _SQL["prune_analysis_cache"],
+                ((now - _ANALYSIS_CACHE_TTL).isoformat(),),
             )
             await db.commit()
 
@@ -228,20 +449,24 @@ class GitHubReposDB:
     ) -> ScoutSearchResult | None:
         await self._ensure_init()
         async with self._connect() as db:
+            # One round trip: every row carries the run header, and a run
+            # without results comes back as a single row of NULL results
             cursor = await db.execute(
-                _sql("get_search_run_info"),
-                (run_id,),
-            )
-            run_row = await cursor.fetchone()
-            if run_row is None:
-                return None
-            cursor = await db.execute(
-                _sql("get_analysis_with_repos"),
+                _SQL["get_search_results"],
                 (run_id,),
             )
-            rows = await cursor.fetchall()
-        results = [_row_to_analysis_result(r) for r in rows]
-        repos = [_row_to_repo_metadata(r) for r in rows]
+            rows = list(await cursor.fetchall())
+        if not rows:
+            return None
+        run_row = rows[0]
+        results: list[AnalysisResult] = []
+        repos: list[RepoMetadata] = []
+        for row in rows:
+            if row[5] is None:
+                continue
+            result, repo = _row_to_result_and_repo(row[5:])
+            results.append(result)
+            repos.append(repo)
         return ScoutSearchResult(
             run_id=run_row[0],
             status=run_row[1],
@@ -257,9 +482,9 @@ class GitHubReposDB:
         cutoff = (
             datetime.now(tz=UTC) - timedelta(days=days)
         ).isoformat()
-        async with self._connect() as db:
+        async with self._write() as db:
             cursor = await db.execute(
-                _sql("prune_stale_repos"),
+                _SQL["prune_stale_repos"],
                 (cutoff,),
             )
             await db.commit()
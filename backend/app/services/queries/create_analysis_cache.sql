@@ -0,0 +1,12 @@
+CREATE TABLE IF NOT EXISTS analysis_cache (
+    profile TEXT NOT NULL,
+    github_id INTEGER NOT NULL,
+    pushed_at TEXT NOT NULL,
+    fit_score REAL NOT NULL,
+    reason TEXT NOT NULL,
+    contributions TEXT,
+    reject INTEGER DEFAULT 0,
+    reject_reason TEXT,
+    analyzed_at TEXT NOT NULL,
+    PRIMARY KEY (profile, github_id, pushed_at)
+);
@@ -0,0 +1,2 @@
+CREATE INDEX IF NOT EXISTS idx_analysis_results_github_id
+ON analysis_results (github_id);
@@ -0,0 +1,9 @@
+CREATE TABLE IF NOT EXISTS readme_cache (
+    owner TEXT NOT NULL,
+    name TEXT NOT NULL,
+    pushed_at TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    text TEXT,
+    fetched_at TEXT NOT NULL,
+    PRIMARY KEY (owner, name, pushed_at, version)
+);
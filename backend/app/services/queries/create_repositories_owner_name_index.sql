@@ -0,0 +1,2 @@
+CREATE INDEX IF NOT EXISTS idx_repositories_owner_name
+ON repositories (owner, name);
@@ -1,2 +0,0 @@
-SELECT github_id FROM repositories
-WHERE owner = ? AND name = ?;
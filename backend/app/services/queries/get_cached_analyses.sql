@@ -0,0 +1,6 @@
+SELECT c.github_id, c.fit_score, c.reason, c.contributions, c.reject, c.reject_reason
+FROM json_each(?) AS k
+JOIN analysis_cache AS c
+    ON c.profile = ?
+    AND c.github_id = json_extract(k.value, '$[0]')
+    AND c.pushed_at = json_extract(k.value, '$[1]');
@@ -0,0 +1,7 @@
+SELECT c.owner, c.name, c.text
+FROM json_each(?) AS k
+JOIN readme_cache AS c
+    ON c.owner = json_extract(k.value, '$[0]')
+    AND c.name = json_extract(k.value, '$[1]')
+    AND c.pushed_at = json_extract(k.value, '$[2]')
+    AND c.version = ?;
@@ -1,4 +1,6 @@
 SELECT
+    s.id, s.status, s.total_discovered,
+    s.total_filtered, s.total_analyzed,
     a.fit_score, a.reason, a.contributions,
     a.reject, a.reject_reason,
     r.github_id, r.owner, r.name, r.url,
@@ -8,7 +10,10 @@ SELECT
     r.pushed_at, r.created_at,
     r.good_first_issue_count,
     r.help_wanted_count
-FROM analysis_results a
-JOIN repositories r ON a.github_id = r.github_id
-WHERE a.run_id = ?
+FROM search_runs s
+LEFT JOIN (
+    analysis_results a
+    JOIN repositories r ON a.github_id = r.github_id
+) ON a.run_id = s.id
+WHERE s.id = ?
 ORDER BY a.fit_score DESC;
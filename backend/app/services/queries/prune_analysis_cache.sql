@@ -0,0 +1,2 @@
+DELETE FROM analysis_cache
+WHERE analyzed_at < ?;
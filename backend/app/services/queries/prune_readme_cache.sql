@@ -0,0 +1,2 @@
+DELETE FROM readme_cache
+WHERE fetched_at < ?;
@@ -0,0 +1,4 @@
+INSERT OR REPLACE INTO analysis_cache
+(profile, github_id, pushed_at, fit_score, reason,
+ contributions, reject, reject_reason, analyzed_at)
+VALUES (?,?,?,?,?,?,?,?,?);
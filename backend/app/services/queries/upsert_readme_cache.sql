@@ -0,0 +1,3 @@
+INSERT OR REPLACE INTO readme_cache
+(owner, name, pushed_at, version, text, fetched_at)
+VALUES (?,?,?,?,?,?);
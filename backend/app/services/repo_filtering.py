@@ -20,11 +20,26 @@ TUTORIAL_PATTERNS = [
     r"\bcoding[-_]challenge\b",
 ]
 _TUTORIAL_RE: re.Pattern[str] = re.compile("|".join(TUTORIAL_PATTERNS), re.IGNORECASE)
+# Every pattern contains one of these words, so a text without any of them
+# cannot match and skips the regex entirely (the common case)
+_TUTORIAL_KEYWORDS = (
+    "awesome",
+    "tutorial",
+    "learn",
+    "cheatsheet",
+    "course",
+    "interview",
+    "curated",
+    "coding",
+)
 
 
 def is_tutorial_or_awesome_list(repo: RepoMetadata) -> bool:
     """Detect tutorial, awesome-list, cheatsheet, or course repos."""
     text = f"{repo.name} {repo.description or ''}"
+    lowered = text.lower()
+    if not any(keyword in lowered for keyword in _TUTORIAL_KEYWORDS):
+        return False
     return bool(_TUTORIAL_RE.search(text))
 
 
@@ -65,5 +80,5 @@ def apply_filters(
         if repo.star_count < min_stars or repo.star_count > max_stars:
             continue
         filtered.append(repo)
-    filtered.sort(key=lambda r: compute_contribution_score(r), reverse=True)
+    filtered.sort(key=compute_contribution_score, reverse=True)
     return filtered
@@ -7,33 +7,32 @@ from app.config import settings
 from app.schemas.scout import AnalysisResult, RepoMetadata, SearchFilters
 from app.services.task_registry import run_agent_streamed
 
-# Approximately 4K tokens for GPT-4o-mini context window
-_README_MAX_CHARS = 16_000
-
 logger = logging.getLogger(__name__)
 
 
 def _format_repo_section(repo: RepoMetadata, readme: str | None) -> str:
     """Format a single repo + readme into a text block for the analysis prompt."""
-    lines = [
-        f"--- {repo.owner}/{repo.name} ---",
-        f"URL: {repo.url}",
-        f"Description: {repo.description or 'N/A'}",
-        f"Primary Language: {repo.primary_language or 'N/A'}",
-        f"Languages: {', '.join(repo.languages)}",
-        f"Stars: {repo.star_count}",
-        f"Open Issues: {repo.open_issue_count}",
-        f"Good First Issues: {repo.good_first_issue_count}",
-        f"Help Wanted: {repo.help_wanted_count}",
-        f"Topics: {', '.join(repo.topics)}",
-        f"License: {repo.license or 'N/A'}",
-        f"Last Pushed: {repo.pushed_at or 'N/A'}",
-    ]
-    if readme:
-        lines.append(f"README (excerpt):\n{readme[:_README_MAX_CHARS]}")
-    else:
-        lines.append("README: Not available")
-    return "\n".join(lines)
+    readme_block = (
+        # fetch_readmes already caps READMEs at README_MAX_CHARS
+        f"README (excerpt):\n{readme}"
+        if readme
+        else "README: Not available"
+    )
+    return (
+        f"--- {repo.owner}/{repo.name} ---\n"
+        f"URL: {repo.url}\n"
+        f"Description: {repo.description or 'N/A'}\n"
+        f"Primary Language: {repo.primary_language or 'N/A'}\n"
+        f"Languages: {', '.join(repo.languages)}\n"
+        f"Stars: {repo.star_count}\n"
+        f"Open Issues: {repo.open_issue_count}\n"
+        f"Good First Issues: {repo.good_first_issue_count}\n"
+        f"Help Wanted: {repo.help_wanted_count}\n"
+        f"Topics: {', '.join(repo.topics)}\n"
+        f"License: {repo.license or 'N/A'}\n"
+        f"Last Pushed: {repo.pushed_at or 'N/A'}\n"
+        f"{readme_block}"
+    )
 
 
 def _build_batch_input(
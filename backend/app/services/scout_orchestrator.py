@@ -89,34 +89,75 @@ def _filter_repos(
 async def _fetch_readmes(
     client: GitHubGraphQLClient, capped: list[RepoMetadata]
 ) -> list[str | None]:
-    """Fetch READMEs and return as ordered list matching capped repos."""
-    readme_pairs = [(r.owner, r.name) for r in capped]
-    readmes_dict = await client.fetch_readmes(readme_pairs)
+    """Fetch READMEs and return as ordered list matching capped repos.
+
+    Repos unchanged since a previous search are served from the README
+    cache; only the misses go to GitHub.
+    """
+    readmes_dict = await github_repos_db.get_cached_readmes(capped)
+    misses = [r for r in capped if f"{r.owner}/{r.name}" not in readmes_dict]
+    if misses:
+        fetched = await client.fetch_readmes([(r.owner, r.name) for r in misses])
+        await github_repos_db.save_readmes(misses, fetched)
+        readmes_dict.update(fetched)
     return [readmes_dict.get(f"{r.owner}/{r.name}") for r in capped]
 
 
+async def _fetch_and_analyze_batch(
+    semaphore: asyncio.Semaphore,
+    client: GitHubGraphQLClient,
+    filters: SearchFilters,
+    repos: list[RepoMetadata],
+    run_id: str,
+) -> list[AnalysisResult]:
+    """Fetch one batch's READMEs, then analyze it once a concurrency slot is free.
+
+    Repos already analyzed for this search profile at their current
+    pushed_at come from the analysis cache; only the misses have their
+    READMEs fetched and go to the LLM. README fetches are not gated, so
+    later batches' READMEs arrive while earlier batches are still with the
+    LLM. The batch timeout starts inside analyze_batch, so time spent
+    waiting for a slot does not count against it.
+    """
+    cached = await github_repos_db.get_cached_analyses(filters, repos)
+    misses = [r for r in repos if r.github_id not in cached]
+    results = list(cached.values())
+    if not misses:
+        return results
+    readmes = await _fetch_readmes(client, misses)
+    async with semaphore:
+        # Don't spend an LLM call on a run cancelled while its READMEs were
+        # fetched or while it waited for a slot
+        _check_cancelled(run_id)
+        fresh = await analyze_batch(filters, misses, readmes, run_id)
+    await github_repos_db.save_analyses(filters, misses, fresh)
+    return results + fresh
+
+
 async def _run_analysis(
     filters: SearchFilters,
     capped: list[RepoMetadata],
-    readmes: list[str | None],
+    client: GitHubGraphQLClient,
     run_id: str,
 ) -> AsyncGenerator[tuple[list[AnalysisResult], Event], None]:
-    """Run batched analysis concurrently, yielding (cumulative_results, event).
+    """Fetch READMEs and run batched analysis concurrently, yielding
+    (cumulative_results, event).
 
     Uses asyncio.wait instead of as_completed to avoid RuntimeWarning
-    from orphaned wrapper coroutines on cancellation.
+    from orphaned wrapper coroutines on cancellation. At most
+    scout_max_concurrent_batches batches call the LLM at once.
     """
     all_results: list[AnalysisResult] = []
     bs = settings.scout_batch_size
     total = len(capped)
     analyzed = 0
 
-    repo_batches = batch_repos(capped, bs)
-    readme_batches = [readmes[i : i + bs] for i in range(0, total, bs)]
-
+    semaphore = asyncio.Semaphore(settings.scout_max_concurrent_batches)
     pending: set[asyncio.Task[list[AnalysisResult]]] = {
-        asyncio.create_task(analyze_batch(filters, rb, rmb, run_id))
-        for rb, rmb in zip(repo_batches, readme_batches)
+        asyncio.create_task(
+            _fetch_and_analyze_batch(semaphore, client, filters, batch, run_id)
+        )
+        for batch in batch_repos(capped, bs)
     }
 
     try:
@@ -197,6 +238,7 @@ async def scout_search_stream(
     run_id: str,
 ) -> AsyncGenerator[Event, None]:
     """Stream the full scout pipeline."""
+    client: GitHubGraphQLClient | None = None
     try:
         yield _status("Searching GitHub...", "discovering")
         client = create_github_client()
@@ -224,13 +266,9 @@ async def scout_search_stream(
         _check_cancelled(run_id)
 
         yield _status(f"Fetching READMEs for {len(capped)} repos...", "filtering")
-        readmes = await _fetch_readmes(client, capped)
-
-        _check_cancelled(run_id)
-
         yield _status("Starting AI analysis...", "analyzing")
         all_results: list[AnalysisResult] = []
-        async for results, event in _run_analysis(filters, capped, readmes, run_id):
+        async for results, event in _run_analysis(filters, capped, client, run_id):
             all_results = results
             yield event
 
@@ -246,3 +284,6 @@ async def scout_search_stream(
         logger.exception("Scout search failed for run %s", run_id)
         await github_repos_db.update_search_run(run_id, "failed", 0, 0, 0)
         yield {"type": "error", "message": f"Scout search failed: {e!s}"}
+    finally:
+        if client is not None:
+            await client.aclose()
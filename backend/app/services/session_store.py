@@ -1,5 +1,6 @@
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+import heapq
+import time
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -7,22 +8,29 @@ if TYPE_CHECKING:
     from app.schemas.drill import Drill
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     session_id: str
     company_name: str
     role: str
     role_description: str | None
+    # time.monotonic() deadline, so expiry is one float compare per read
+    expires_at: float
     company_summary: "CompanySummary | None" = None
     current_drill: "Drill | None" = None
     last_feedback_summary: str | None = None
-    created_at: datetime = field(default_factory=datetime.utcnow)
 
 
 class SessionStore:
-    def __init__(self, ttl_hours: int = 24):
+    def __init__(self, ttl_hours: int = 24, max_size: int = 10_000):
+        # Insertion order doubles as recency order: hits are moved to the
+        # end, so the first key is the least recently used session
         self._sessions: dict[str, Session] = {}
-        self._ttl = timedelta(hours=ttl_hours)
+        self._ttl_secs = ttl_hours * 3600
+        self._max_size = max_size
+        # Min-heap of (expires_at, session_id), swept on create so expired
+        # sessions are evicted even if they are never read again
+        self._expiry: list[tuple[float, str]] = []
 
     def create(
         self,
@@ -31,20 +39,43 @@ class SessionStore:
         role: str,
         role_description: str | None = None,
     ) -> Session:
+        now = time.monotonic()
+        self._evict_expired(now)
+        self._sessions.pop(session_id, None)
+        if len(self._sessions) >= self._max_size:
+            self._sessions.pop(next(iter(self._sessions)))
         session = Session(
             session_id=session_id,
             company_name=company_name,
             role=role,
             role_description=role_description,
+            expires_at=now + self._ttl_secs,
         )
         self._sessions[session_id] = session
+        heapq.heappush(self._expiry, (session.expires_at, session_id))
         return session
 
+    def _evict_expired(self, now: float) -> None:
+        """Drop sessions whose heap entry has expired.
+
+        A heap entry can outlive its session when the id was re-created, so
+        the stored session is only removed if it has itself expired.
+        """
+        while self._expiry and self._expiry[0][0] <= now:
+            _, session_id = heapq.heappop(self._expiry)
+            session = self._sessions.get(session_id)
+            if session and session.expires_at <= now:
+                del self._sessions[session_id]
+
     def get(self, session_id: str) -> Session | None:
         session = self._sessions.get(session_id)
-        if session and datetime.utcnow() - session.created_at < self._ttl:
-            return session
-        return None
+        if session is None:
+            return None
+        del self._sessions[session_id]
+        if time.monotonic() >= session.expires_at:
+            return None
+        self._sessions[session_id] = session  # Reinsert as most recently used
+        return session
 
     def update_company_summary(self, session_id: str, company_summary: "CompanySummary") -> bool:
         """Update session with company research summary."""
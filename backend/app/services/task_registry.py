@@ -1,5 +1,4 @@
 import asyncio
-from threading import Lock
 from typing import TypeVar
 
 from agents import Agent, Runner
@@ -9,49 +8,61 @@ T = TypeVar("T")
 
 
 class TaskRegistry:
-    """Tracks active RunResultStreaming objects per session for cancellation."""
+    """Tracks active RunResultStreaming objects per session for cancellation.
 
-    def __init__(self) -> None:
-        self._active: dict[str, list[RunResultStreaming]] = {}
+    Only used from the event loop thread, and no method awaits, so each
+    call runs to completion without interleaving and needs no lock.
+    """
+
+    def __init__(self, max_per_session: int = 64) -> None:
+        # Keyed by id(result): RunResultStreaming is an unhashable dataclass
+        # whose __eq__ compares fields, so identity keys keep removal O(1)
+        self._active: dict[str, dict[int, RunResultStreaming]] = {}
         self._cancelled: set[str] = set()
-        self._lock = Lock()
+        self._max_per_session = max_per_session
 
     def register(self, session_id: str, result: RunResultStreaming) -> None:
-        with self._lock:
-            if session_id in self._cancelled:
-                result.cancel(mode="immediate")
-                return
-            self._active.setdefault(session_id, []).append(result)
+        """Track a run for cancellation.
+
+        Raises:
+            RuntimeError: If the session already has max_per_session active
+                runs; the new run is cancelled first so it does not run untracked
+        """
+        if session_id in self._cancelled:
+            result.cancel(mode="immediate")
+            return
+        results = self._active.setdefault(session_id, {})
+        if len(results) >= self._max_per_session:
+            result.cancel(mode="immediate")
+            raise RuntimeError(
+                f"Session {session_id} already has {len(results)} active agent runs"
+            )
+        results[id(result)] = result
 
     def unregister(self, session_id: str, result: RunResultStreaming) -> None:
         """Remove a specific result from tracking."""
-        with self._lock:
-            if session_id in self._active:
-                try:
-                    self._active[session_id].remove(result)
-                    # Clean up empty lists
-                    if not self._active[session_id]:
-                        del self._active[session_id]
-                except ValueError:
-                    pass  # Already removed
+        results = self._active.get(session_id)
+        if results is None:
+            return
+        results.pop(id(result), None)  # None if already removed
+        # Clean up empty sessions
+        if not results:
+            del self._active[session_id]
 
     def is_cancelled(self, session_id: str) -> bool:
-        with self._lock:
-            return session_id in self._cancelled
+        return session_id in self._cancelled
 
     def cancel_all(self, session_id: str) -> None:
-        with self._lock:
-            self._cancelled.add(session_id)
-            results = self._active.pop(session_id, [])
-        for result in results:
+        self._cancelled.add(session_id)
+        results = self._active.pop(session_id, {})
+        for result in results.values():
             if not result.is_complete:
                 result.cancel(mode="immediate")
 
     def cleanup(self, session_id: str) -> None:
-        with self._lock:
-            results = self._active.pop(session_id, [])
-            self._cancelled.discard(session_id)
-        for result in results:
+        results = self._active.pop(session_id, {})
+        self._cancelled.discard(session_id)
+        for result in results.values():
             if not result.is_complete:
                 result.cancel(mode="immediate")
 
@@ -74,15 +85,16 @@ async def run_agent_streamed(
     result = Runner.run_streamed(agent, agent_input)
     task_registry.register(session_id, result)
     try:
-        async def consume() -> None:
+        async with asyncio.timeout(timeout):
             async for _ in result.stream_events():
                 pass
-
-        await asyncio.wait_for(consume(), timeout=timeout)
         # result.final_output is typed as Any by the agents library
         # Safe to return since we validate agent output_type matches T
         return result.final_output  # type: ignore[no-any-return]
-    except TimeoutError:
+    except BaseException:
+        # Stop the background run on timeout, error or cancellation of the
+        # caller; the SDK only does so itself when cancelled while waiting on
+        # its event queue. Cancelling a finished run is harmless.
         result.cancel(mode="immediate")
         raise
     finally:
@@ -8,6 +8,16 @@ def sanitize_input(text: str, max_length: int = 8000) -> str:
     Returns:
         Sanitized text with normalized whitespace and enforced length limit
     """
+    # Already-normalized text skips the split/join copy. str.isprintable() is
+    # False for every whitespace character except the ASCII space, so only
+    # doubled or edge spaces are left to rule out.
+    if (
+        text.isprintable()
+        and "  " not in text
+        and not text.startswith(" ")
+        and not text.endswith(" ")
+    ):
+        return text[:max_length]
     # Normalize whitespace (replace tabs, newlines, multiple spaces with single space)
     text = " ".join(text.split())
     # Enforce length limit
@@ -1,21 +1,49 @@
 """Shared test fixtures and utilities."""
 
-from unittest.mock import MagicMock
+import asyncio
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any
 
+import pytest
 
-def mock_streamed_result(final_output):
-    """Create a mock that behaves like RunResultStreaming.
+from app.services.company_research import clear_research_cache
 
-    This helper is used across multiple test files to simulate
-    the behavior of agents.result.RunResultStreaming objects.
+
+@pytest.fixture(autouse=True)
+def _clear_research_cache():
+    """Keep cached company research from leaking between tests."""
+    clear_research_cache()
+    yield
+    clear_research_cache()
+
+
+@dataclass
+class FakeStreamedResult:
+    """Minimal stand-in for agents.result.RunResultStreaming.
+
+    A plain dataclass rather than a MagicMock: it is built for every agent
+    call in the service tests and has no attribute magic to set up.
     """
-    mock = MagicMock()
-    mock.final_output = final_output
-    mock.is_complete = True
 
-    async def empty_stream():
+    final_output: Any
+    is_complete: bool = True
+    delay: float = 0.0  # Seconds the stream stalls before ending, to trip timeouts
+
+    async def stream_events(self) -> AsyncIterator[Any]:
+        if self.delay:
+            await asyncio.sleep(self.delay)
         return
         yield  # makes it an async generator
 
-    mock.stream_events = empty_stream
-    return mock
+    def cancel(self, mode: str = "immediate") -> None:
+        self.is_complete = True
+
+
+def mock_streamed_result(final_output: Any) -> FakeStreamedResult:
+    """Create a fake that behaves like a completed RunResultStreaming.
+
+    This helper is used across multiple test files to simulate
+    the behavior of agents.result.RunResultStreaming objects.
+    """
+    return FakeStreamedResult(final_output)
@@ -5,16 +5,20 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from app.services.company_research import research_company_stream
-from tests.conftest import mock_streamed_result
+from app.schemas.company_info import CompanySummary, SearchPlan, SearchQuery
+from app.services.company_research import (
+    _dedupe_searches,
+    _execute_searches,
+    cache_research,
+    get_cached_research,
+    research_company_stream,
+)
+from tests.conftest import FakeStreamedResult, mock_streamed_result
 
 
 async def collect_events(stream):
     """Helper to collect all events from an async generator."""
-    events = []
-    async for event in stream:
-        events.append(event)
-    return events
+    return [event async for event in stream]
 
 
 class TestCompanyResearchTimeout:
@@ -26,21 +30,10 @@ class TestCompanyResearchTimeout:
         with patch("app.services.company_research.settings") as mock_settings:
             mock_settings.company_research_agent_timeout = 0.01  # 10ms
 
-            def slow_streamed(agent, input_str):
-                mock = MagicMock()
-                mock.final_output = None
-                mock.is_complete = False
-
-                async def slow_stream():
-                    await asyncio.sleep(0.1)  # 100ms > 10ms timeout
-                    yield  # makes it an async generator
-
-                mock.stream_events = slow_stream
-                return mock
-
             with patch(
                 "app.services.task_registry.Runner.run_streamed",
-                side_effect=slow_streamed,
+                # 100ms stream > 10ms timeout
+                return_value=FakeStreamedResult(None, is_complete=False, delay=0.1),
             ):
                 events = await collect_events(
                     research_company_stream("TestCo", "Developer", "test-session")
@@ -55,50 +48,25 @@ class TestCompanyResearchTimeout:
         with patch("app.services.company_research.settings") as mock_settings:
             mock_settings.company_research_agent_timeout = 0.01  # 10ms
 
-            call_count = [0]
-
-            def mock_run_streamed(agent, input_str):
-                call_count[0] += 1
-                current = call_count[0]
-
-                # Planner returns quickly with 2 searches
-                if current == 1:
-                    plan_mock = MagicMock()
-                    plan_mock.searches = [
-                        MagicMock(query="q1", reason="r1"),
-                        MagicMock(query="q2", reason="r2"),
-                    ]
-                    return mock_streamed_result(plan_mock)
-
-                # First search times out
-                if current == 2:
-                    mock = MagicMock()
-                    mock.final_output = None
-                    mock.is_complete = False
-
-                    async def slow_stream():
-                        await asyncio.sleep(0.1)
-                        yield
-
-                    mock.stream_events = slow_stream
-                    return mock
-
-                # Second search succeeds
-                if current == 3:
-                    return mock_streamed_result("search result")
-
-                # Summarizer succeeds
-                if current == 4:
-                    summary_mock = MagicMock()
-                    summary_mock.model_dump = lambda: {"summary": "test"}
-                    return mock_streamed_result(summary_mock)
-
-                return mock_streamed_result(MagicMock())
+            plan_mock = MagicMock()
+            plan_mock.searches = [
+                MagicMock(query="q1", reason="r1"),
+                MagicMock(query="q2", reason="r2"),
+            ]
+            summary_mock = MagicMock()
+            summary_mock.model_dump = lambda: {"summary": "test"}
+            # Planner, first search (times out), second search, summarizer
+            responses = [
+                mock_streamed_result(plan_mock),
+                FakeStreamedResult(None, is_complete=False, delay=0.1),
+                mock_streamed_result("search result"),
+                mock_streamed_result(summary_mock),
+            ]
 
             with patch(
                 "app.services.task_registry.Runner.run_streamed",
-                side_effect=mock_run_streamed,
-            ):
+                side_effect=iter(responses),
+            ) as run_streamed:
                 events = await collect_events(
                     research_company_stream("TestCo", "Developer", "test-session")
                 )
@@ -107,4 +75,211 @@ class TestCompanyResearchTimeout:
         status_messages = [e["message"] for e in events if e["type"] == "status"]
         assert any("timed out" in msg.lower() for msg in status_messages)
         # Should have completed (or at least tried summarizer)
-        assert call_count[0] >= 3
+        assert run_streamed.call_count >= 3
+
+
+def _successful_pipeline(call_count):
+    """Build a run_streamed side effect for planner -> one search -> summarizer."""
+
+    def mock_run_streamed(agent, input_str):
+        call_count[0] += 1
+        if agent.name == "CompanyPlannerAgent":
+            return mock_streamed_result(
+                SearchPlan(searches=[SearchQuery(query="q1", reason="r1")])
+            )
+        if agent.name == "CompanySearchAgent":
+            return mock_streamed_result("search result")
+        return mock_streamed_result(CompanySummary(name="TestCo", description="A company"))
+
+    return mock_run_streamed
+
+
+class TestCompanyResearchCache:
+    """Tests for caching research results per company/role."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_research_served_from_cache(self):
+        """Second request for same company/role does not run any agents."""
+        call_count = [0]
+        with patch(
+            "app.services.task_registry.Runner.run_streamed",
+            side_effect=_successful_pipeline(call_count),
+        ):
+            first = await collect_events(
+                research_company_stream("TestCo", "Developer", "session-1")
+            )
+            calls_after_first = call_count[0]
+            second = await collect_events(
+                research_company_stream("  testco ", "DEVELOPER", "session-2")
+            )
+
+        assert calls_after_first == 3
+        assert call_count[0] == calls_after_first
+        assert second[-1] == first[-1]
+        assert second[-1]["type"] == "complete"
+
+    @pytest.mark.asyncio
+    async def test_different_role_is_not_cached(self):
+        """A different role for the same company runs the full pipeline."""
+        call_count = [0]
+        with patch(
+            "app.services.task_registry.Runner.run_streamed",
+            side_effect=_successful_pipeline(call_count),
+        ):
+            await collect_events(research_company_stream("TestCo", "Developer", "s1"))
+            await collect_events(research_company_stream("TestCo", "QA Engineer", "s2"))
+
+        assert call_count[0] == 6
+
+    def test_expired_entry_is_not_returned(self):
+        """Entries past their TTL are dropped on lookup."""
+        summary = CompanySummary(name="TestCo", description="A company")
+        with patch("app.services.company_research.settings") as mock_settings:
+            mock_settings.company_research_cache_ttl = -1.0
+            mock_settings.company_research_cache_max_size = 10
+            cache_research("TestCo", "Developer", summary)
+
+        assert get_cached_research("TestCo", "Developer") is None
+
+    def test_oldest_entry_evicted_when_full(self):
+        """Cache never grows past its max size."""
+        summary = CompanySummary(name="TestCo", description="A company")
+        with patch("app.services.company_research.settings") as mock_settings:
+            mock_settings.company_research_cache_ttl = 60.0
+            mock_settings.company_research_cache_max_size = 2
+            cache_research("A", "Developer", summary)
+            cache_research("B", "Developer", summary)
+            cache_research("C", "Developer", summary)
+
+        assert get_cached_research("A", "Developer") is None
+        assert get_cached_research("B", "Developer") is summary
+        assert get_cached_research("C", "Developer") is summary
+
+    def test_recently_read_entry_survives_eviction(self):
+        """A cache hit makes the entry most recently used."""
+        summary = CompanySummary(name="TestCo", description="A company")
+        with patch("app.services.company_research.settings") as mock_settings:
+            mock_settings.company_research_cache_ttl = 60.0
+            mock_settings.company_research_cache_max_size = 2
+            cache_research("A", "Developer", summary)
+            cache_research("B", "Developer", summary)
+            get_cached_research("A", "Developer")
+            cache_research("C", "Developer", summary)
+
+        assert get_cached_research("A", "Developer") is summary
+        assert get_cached_research("B", "Developer") is None
+
+    def test_expired_entries_evicted_before_live_ones(self):
+        """Stale entries make room before any live entry is evicted."""
+        summary = CompanySummary(name="TestCo", description="A company")
+        with patch("app.services.company_research.settings") as mock_settings:
+            mock_settings.company_research_cache_max_size = 2
+            mock_settings.company_research_cache_ttl = 60.0
+            cache_research("A", "Developer", summary)
+            mock_settings.company_research_cache_ttl = -1.0
+            cache_research("B", "Developer", summary)
+            mock_settings.company_research_cache_ttl = 60.0
+            cache_research("C", "Developer", summary)
+
+        assert get_cached_research("A", "Developer") is summary
+        assert get_cached_research("C", "Developer") is summary
+
+
+class TestExecuteSearches:
+    """Tests for the parallel search stream."""
+
+    @pytest.mark.asyncio
+    async def test_closing_stream_cancels_running_searches(self):
+        """
+        GIVEN one fast and one hanging search
+        WHEN the consumer closes the stream after the first event
+        THEN the hanging search task is cancelled, not left running
+        """
+        hanging_cancelled = asyncio.Event()
+
+        async def fake_search(item, session_id):
+            if item.query == "fast":
+                return (item.reason, "result", "success")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                hanging_cancelled.set()
+                raise
+            return (item.reason, None, "failed")
+
+        searches = [
+            SearchQuery(query="fast", reason="r1"),
+            SearchQuery(query="slow", reason="r2"),
+        ]
+        with patch(
+            "app.services.company_research._run_single_search",
+            side_effect=fake_search,
+        ):
+            stream = _execute_searches(searches, "s1")
+            first = await anext(stream)
+            await stream.aclose()
+
+        assert first == {"type": "status", "message": "Completed (1/2): r1"}
+        assert hanging_cancelled.is_set()
+
+
+class TestDedupeSearches:
+    """Tests for collapsing duplicate planner searches."""
+
+    def test_normalized_duplicates_are_collapsed(self):
+        searches = [
+            SearchQuery(query="Acme tech stack", reason="Stack"),
+            SearchQuery(query="  acme   TECH stack ", reason="Engineering tools"),
+            SearchQuery(query="Acme interviews", reason="Process"),
+        ]
+
+        result = _dedupe_searches(searches)
+
+        assert [s.query for s in result] == ["Acme tech stack", "Acme interviews"]
+        assert result[0].reason == "Stack; Engineering tools"
+
+    def test_identical_reasons_are_not_repeated(self):
+        searches = [
+            SearchQuery(query="Acme news", reason="News"),
+            SearchQuery(query="acme news", reason="News"),
+        ]
+
+        assert _dedupe_searches(searches) == [SearchQuery(query="Acme news", reason="News")]
+
+    def test_reason_contained_in_another_is_kept(self):
+        searches = [
+            SearchQuery(query="Acme stack", reason="tech stack"),
+            SearchQuery(query="acme stack", reason="tech"),
+        ]
+
+        assert _dedupe_searches(searches)[0].reason == "tech stack; tech"
+
+    @pytest.mark.asyncio
+    async def test_duplicate_queries_run_one_search(self):
+        """The search agent runs once per unique query."""
+        agent_calls: list[str] = []
+
+        def mock_run_streamed(agent, input_str):
+            agent_calls.append(agent.name)
+            if agent.name == "CompanyPlannerAgent":
+                return mock_streamed_result(
+                    SearchPlan(
+                        searches=[
+                            SearchQuery(query="Acme news", reason="r1"),
+                            SearchQuery(query="acme NEWS", reason="r2"),
+                        ]
+                    )
+                )
+            if agent.name == "CompanySearchAgent":
+                return mock_streamed_result("search result")
+            return mock_streamed_result(CompanySummary(name="Acme", description="A company"))
+
+        with patch(
+            "app.services.task_registry.Runner.run_streamed",
+            side_effect=mock_run_streamed,
+        ):
+            events = await collect_events(research_company_stream("Acme", "Developer", "s1"))
+
+        assert agent_calls.count("CompanySearchAgent") == 1
+        assert {"type": "status", "message": "Found 1 areas to research"} in events
+        assert events[-1]["type"] == "complete"
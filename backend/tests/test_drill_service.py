@@ -4,12 +4,15 @@ import asyncio
 from unittest.mock import MagicMock, patch
 
 import pytest
+from agents.exceptions import InputGuardrailTripwireTriggered
 
 from app.schemas.company_info import CompanySummary, TechStack
-from app.schemas.drill import DrillType
+from app.schemas.drill import DifficultyLevel, Drill, DrillCandidate, DrillEvaluation, DrillType
 from app.services.drill_generation import (
+    ALL_GENERATORS,
     _build_evaluator_input,
     _build_generator_input,
+    generate_drill,
     generate_drill_stream,
 )
 from tests.conftest import mock_streamed_result
@@ -101,6 +104,31 @@ class TestBuildEvaluatorInput:
         assert "Coding Challenge" in result
         assert "Debug Task" in result
 
+    def test_evaluator_input_includes_optional_fields(self):
+        """Starter code and hints appear only when the drill has them."""
+        drill = Drill(
+            title="Cache",
+            type=DrillType.CODING,
+            difficulty=DifficultyLevel.HARD,
+            description="Build an LRU cache",
+            requirements=["O(1) get", "O(1) put"],
+            expected_time_minutes=45,
+            starter_code="class LRU: ...",
+            hints=["Use a dict", "Use a linked list"],
+        )
+        candidate = DrillCandidate(
+            drill=drill,
+            generator_type=DrillType.CODING,
+            reasoning="Classic",
+            confidence_score=0.9,
+        )
+        result = _build_evaluator_input("Google", "Backend Developer", [candidate])
+
+        assert "Requirements: O(1) get, O(1) put" in result
+        assert "Starter Code:\n```\nclass LRU: ...\n```" in result
+        assert "Hints: Use a dict, Use a linked list" in result
+        assert "Company Context: N/A" in result
+
 
 class TestDrillGenerationTimeout:
     """Tests for timeout behavior in drill generation."""
@@ -185,3 +213,117 @@ class TestDrillGenerationTimeout:
         # Should have continued despite one timeout
         status_messages = [e.get("message", "") for e in events if e["type"] == "status"]
         assert any("timed out" in msg.lower() for msg in status_messages)
+
+
+def _make_candidate(title: str, drill_type: DrillType) -> DrillCandidate:
+    return DrillCandidate(
+        drill=Drill(
+            title=title,
+            type=drill_type,
+            difficulty=DifficultyLevel.MEDIUM,
+            description=f"Description for {title}",
+            requirements=["Requirement 1"],
+            expected_time_minutes=30,
+        ),
+        generator_type=drill_type,
+        reasoning="Relevant",
+        confidence_score=0.8,
+    )
+
+
+class TestGenerateDrill:
+    """Tests for non-streaming drill generation."""
+
+    @pytest.mark.asyncio
+    async def test_failed_generators_are_skipped(self):
+        """A failing generator is dropped and the evaluator picks among the rest."""
+        coding = _make_candidate("Coding", DrillType.CODING)
+        design = _make_candidate("Design", DrillType.SYSTEM_DESIGN)
+
+        def mock_run_streamed(agent, input_str):
+            if agent.name == "CodingDrillAgent":
+                return mock_streamed_result(coding)
+            if agent.name == "DesignDrillAgent":
+                return mock_streamed_result(design)
+            if agent.name == "DebuggingDrillAgent":
+                raise RuntimeError("boom")
+            return mock_streamed_result(
+                DrillEvaluation(
+                    selected_drill=design.drill,
+                    selected_generator=DrillType.SYSTEM_DESIGN,
+                    selection_reasoning="Best fit",
+                    evaluations=[],
+                )
+            )
+
+        with patch(
+            "app.services.task_registry.Runner.run_streamed",
+            side_effect=mock_run_streamed,
+        ):
+            drill = await generate_drill("TestCo", "Developer", "test-session")
+
+        assert drill == design.drill
+
+    @pytest.mark.asyncio
+    async def test_guardrail_trip_propagates(self):
+        """Guardrail exceptions from a generator are re-raised, not swallowed."""
+
+        def mock_run_streamed(agent, input_str):
+            if agent.name == "DebuggingDrillAgent":
+                raise InputGuardrailTripwireTriggered(MagicMock())
+            return mock_streamed_result(_make_candidate("Coding", DrillType.CODING))
+
+        with patch(
+            "app.services.task_registry.Runner.run_streamed",
+            side_effect=mock_run_streamed,
+        ):
+            with pytest.raises(InputGuardrailTripwireTriggered):
+                await generate_drill("TestCo", "Developer", "test-session")
+
+
+class TestSingleGenerator:
+    """Tests for the single-generator shortcut."""
+
+    @pytest.mark.asyncio
+    async def test_stream_skips_evaluator_and_parallel_status(self):
+        """With one generator configured, its drill completes without evaluation."""
+        coding = _make_candidate("Coding", DrillType.CODING)
+        agent_calls: list[str] = []
+
+        def mock_run_streamed(agent, input_str):
+            agent_calls.append(agent.name)
+            return mock_streamed_result(coding)
+
+        with (
+            patch("app.services.drill_generation.SELECTED_GENERATORS", ALL_GENERATORS[:1]),
+            patch(
+                "app.services.task_registry.Runner.run_streamed",
+                side_effect=mock_run_streamed,
+            ),
+        ):
+            events = [
+                e async for e in generate_drill_stream("TestCo", "Developer", "test-session")
+            ]
+
+        assert agent_calls == ["CodingDrillAgent"]
+        messages = [e["message"] for e in events if e["type"] == "status"]
+        assert "Generating drill candidate..." in messages
+        assert not any("parallel" in m or "Only one" in m for m in messages)
+        assert {"type": "candidate", "generator": "coding", "title": "Coding"} in events
+        assert events[-1] == {"type": "complete", "data": coding.drill.model_dump()}
+
+    @pytest.mark.asyncio
+    async def test_generate_drill_returns_lone_candidate(self):
+        """Non-streaming generation returns the only generator's drill directly."""
+        coding = _make_candidate("Coding", DrillType.CODING)
+
+        with (
+            patch("app.services.drill_generation.SELECTED_GENERATORS", ALL_GENERATORS[:1]),
+            patch(
+                "app.services.task_registry.Runner.run_streamed",
+                return_value=mock_streamed_result(coding),
+            ),
+        ):
+            drill = await generate_drill("TestCo", "Developer", "test-session")
+
+        assert drill == coding.drill
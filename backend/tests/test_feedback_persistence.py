@@ -0,0 +1,160 @@
+"""Tests for feedback markdown persistence."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+from app.schemas.evaluation import ImprovementItem, SolutionFeedback, StrengthItem
+from app.services.feedback_persistence import (
+    format_feedback_markdown,
+    generate_feedback_path,
+    sanitize_filename,
+    save_feedback,
+    save_feedback_async,
+    write_unique_file,
+)
+
+
+def make_feedback(score: float = 8.0) -> SolutionFeedback:
+    return SolutionFeedback(
+        score=score,
+        strengths=[StrengthItem(title="Clear naming", description="Uses `count` well")],
+        improvements=[
+            ImprovementItem(
+                title="Edge cases",
+                description="Empty input is not handled",
+                suggestion="Return early on empty input",
+            )
+        ],
+        summary_for_next_drill="Practice edge cases",
+    )
+
+
+class TestSanitizeFilename:
+    """Tests for sanitize_filename."""
+
+    def test_replaces_spaces_and_symbols(self):
+        assert sanitize_filename("Backend Developer") == "backend_developer"
+        assert sanitize_filename("AT&T / Labs") == "at_t_labs"
+
+    def test_keeps_hyphens(self):
+        assert sanitize_filename("Coca-Cola") == "coca-cola"
+
+    def test_collapses_and_strips_underscores(self):
+        assert sanitize_filename("__a   b__") == "a_b"
+
+    def test_keeps_unicode_word_characters(self):
+        assert sanitize_filename("Café Zürich!") == "café_zürich"
+
+
+class TestGenerateFeedbackPath:
+    """Tests for generate_feedback_path."""
+
+    def test_path_format(self):
+        # GIVEN a fixed timestamp
+        timestamp = datetime(2026, 1, 28, 19, 2)
+
+        # WHEN generating the path
+        path = generate_feedback_path("Meta", "Full Stack Developer", timestamp)
+
+        # THEN it follows docs/drills/feedbacks/<dd-mm-yyyy_hh-mm>/<company>_<role>.md
+        assert path.as_posix() == (
+            "docs/drills/feedbacks/28-01-2026_19-02/meta_full_stack_developer.md"
+        )
+
+
+class TestWriteUniqueFile:
+    """Tests for write_unique_file."""
+
+    def test_writes_original_path_when_free(self, tmp_path):
+        path = tmp_path / "nested" / "feedback.md"
+
+        assert write_unique_file(path, "hello") == path
+        assert path.read_text(encoding="utf-8") == "hello"
+
+    def test_adds_numeric_suffix_without_overwriting(self, tmp_path):
+        (tmp_path / "feedback.md").write_text("a")
+        (tmp_path / "feedback_1.md").write_text("b")
+
+        path = write_unique_file(tmp_path / "feedback.md", "c")
+
+        assert path == tmp_path / "feedback_2.md"
+        assert (tmp_path / "feedback.md").read_text() == "a"
+        assert path.read_text() == "c"
+
+    def test_reuses_existing_file_with_identical_content(self, tmp_path):
+        (tmp_path / "feedback.md").write_text("a")
+        (tmp_path / "feedback_1.md").write_text("b")
+
+        path = write_unique_file(tmp_path / "feedback.md", "b")
+
+        assert path == tmp_path / "feedback_1.md"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["feedback.md", "feedback_1.md"]
+
+
+class TestFormatFeedbackMarkdown:
+    """Tests for format_feedback_markdown."""
+
+    def test_empty_sections_use_placeholders(self):
+        feedback = SolutionFeedback(
+            score=3.0, strengths=[], improvements=[], summary_for_next_drill="Start over"
+        )
+
+        content = format_feedback_markdown(
+            feedback, "Meta", "QA Engineer", "Parse {logs}", datetime(2026, 2, 1, 17, 51)
+        )
+
+        assert content.startswith("# Feedback: Parse {logs}\n\n**Company:** Meta\n")
+        assert "**Date:** 2026-02-01 17:51" in content
+        assert "**Score:** 3.0/10 (Needs Improvement)" in content
+        assert "## Strengths\n\n_No specific strengths noted._\n\n---" in content
+        assert "_No specific improvements noted._\n\n---" in content
+        assert content.endswith("## Summary for Next Practice\n\nStart over\n")
+
+
+class TestSaveFeedback:
+    """Tests for save_feedback."""
+
+    def test_writes_markdown_relative_to_project_root(self, tmp_path):
+        # WHEN saving feedback
+        relative = save_feedback(make_feedback(), "Meta", "DevOps Engineer", "Fix it", tmp_path)
+
+        # THEN the file exists under the project root with the formatted content
+        assert not relative.is_absolute()
+        content = (tmp_path / relative).read_text(encoding="utf-8")
+        assert content.startswith("# Feedback: Fix it\n")
+        assert "**Score:** 8.0/10 (Good)" in content
+        assert "### Clear naming" in content
+        assert "**Suggestion:** Return early on empty input" in content
+        assert content.endswith("Practice edge cases\n")
+
+    def test_second_save_gets_suffix(self, tmp_path):
+        with patch("app.services.feedback_persistence.datetime") as mock_datetime:
+            mock_datetime.now.return_value = datetime(2026, 1, 28, 19, 10)
+            first = save_feedback(make_feedback(), "Meta", "DevOps Engineer", "Fix it", tmp_path)
+            second = save_feedback(
+                make_feedback(4.0), "Meta", "DevOps Engineer", "Fix it", tmp_path
+            )
+
+        assert first != second
+        assert second.stem.endswith("_1")
+
+    def test_identical_resave_returns_same_path(self, tmp_path):
+        with patch("app.services.feedback_persistence.datetime") as mock_datetime:
+            mock_datetime.now.return_value = datetime(2026, 1, 28, 19, 10)
+            first = save_feedback(make_feedback(), "Meta", "DevOps Engineer", "Fix it", tmp_path)
+            second = save_feedback(make_feedback(), "Meta", "DevOps Engineer", "Fix it", tmp_path)
+
+        assert first == second
+
+
+class TestSaveFeedbackAsync:
+    """Tests for save_feedback_async."""
+
+    async def test_writes_same_file_as_sync_version(self, tmp_path):
+        relative = await save_feedback_async(
+            make_feedback(), "Meta", "DevOps Engineer", "Fix it", tmp_path
+        )
+
+        content = (tmp_path / relative).read_text(encoding="utf-8")
+        assert content.startswith("# Feedback: Fix it\n")
+
@@ -1,14 +1,20 @@
 """Tests for GitHub GraphQL API client — RED phase."""
 
+import asyncio
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, patch
 
 import httpx
 import pytest
 
-from app.schemas.scout import SearchFilters
+from app.schemas.scout import RepoMetadata, SearchFilters
 from app.services.github_client import (
     GitHubGraphQLClient,
+    RateLimitBudget,
+    _build_readme_query,
     _build_search_query_string,
+    _parse_repo_node,
+    _truncate_readme,
     create_github_client,
 )
 
@@ -52,7 +58,10 @@ class TestGitHubGraphQLClient:
         mock_post = AsyncMock(side_effect=[error_response, success_response])
 
         # WHEN
-        with patch("httpx.AsyncClient.post", mock_post):
+        with (
+            patch("httpx.AsyncClient.post", mock_post),
+            patch("app.services.github_client.asyncio.sleep", new_callable=AsyncMock),
+        ):
             result = await client._execute_query(query)
 
         # THEN
@@ -84,6 +93,67 @@ class TestGitHubGraphQLClient:
         # Verify only one call was made (no retries)
         assert mock_post.call_count == 1
 
+    async def test_429_waits_for_retry_after_then_succeeds(self):
+        """GIVEN httpx returns 429 with Retry-After, then 200
+        WHEN _execute_query is called
+        THEN it sleeps exactly Retry-After seconds and retries
+        """
+        # GIVEN
+        client = GitHubGraphQLClient("valid_token")
+        request = httpx.Request("POST", GitHubGraphQLClient.GRAPHQL_URL)
+        limited = httpx.Response(status_code=429, headers={"Retry-After": "3"}, request=request)
+        success = httpx.Response(status_code=200, json={"data": {"ok": True}}, request=request)
+        mock_post = AsyncMock(side_effect=[limited, success])
+
+        # WHEN
+        with (
+            patch("httpx.AsyncClient.post", mock_post),
+            patch("app.services.github_client.asyncio.sleep", new_callable=AsyncMock) as sleep,
+        ):
+            result = await client._execute_query("{ ok }")
+
+        # THEN
+        assert result == {"ok": True}
+        sleep.assert_awaited_once_with(3.0)
+
+    async def test_403_without_rate_limit_headers_raises_immediately(self):
+        """GIVEN httpx returns 403 with no rate-limit hints
+        WHEN _execute_query is called
+        THEN it raises without retrying
+        """
+        # GIVEN
+        client = GitHubGraphQLClient("valid_token")
+        forbidden = httpx.Response(
+            status_code=403, request=httpx.Request("POST", GitHubGraphQLClient.GRAPHQL_URL)
+        )
+        mock_post = AsyncMock(return_value=forbidden)
+
+        # WHEN / THEN
+        with patch("httpx.AsyncClient.post", mock_post):
+            with pytest.raises(httpx.HTTPStatusError):
+                await client._execute_query("{ ok }")
+        assert mock_post.call_count == 1
+
+    async def test_403_with_distant_reset_raises_immediately(self):
+        """GIVEN a 403 whose X-RateLimit-Reset is beyond MAX_RATE_LIMIT_WAIT
+        WHEN _execute_query is called
+        THEN it raises instead of waiting
+        """
+        # GIVEN
+        client = GitHubGraphQLClient("valid_token")
+        forbidden = httpx.Response(
+            status_code=403,
+            headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "4102444800"},
+            request=httpx.Request("POST", GitHubGraphQLClient.GRAPHQL_URL),
+        )
+        mock_post = AsyncMock(return_value=forbidden)
+
+        # WHEN / THEN
+        with patch("httpx.AsyncClient.post", mock_post):
+            with pytest.raises(httpx.HTTPStatusError):
+                await client._execute_query("{ ok }")
+        assert mock_post.call_count == 1
+
     async def test_retry_exhaustion_raises_exception(self):
         """GIVEN httpx returns 502 on all retry attempts
         WHEN _execute_query is called
@@ -102,13 +172,21 @@ class TestGitHubGraphQLClient:
         mock_post = AsyncMock(return_value=error_response)
 
         # WHEN / THEN
-        with patch("httpx.AsyncClient.post", mock_post):
+        with (
+            patch("httpx.AsyncClient.post", mock_post),
+            patch("app.services.github_client.asyncio.sleep", new_callable=AsyncMock) as sleep,
+        ):
             with pytest.raises(httpx.HTTPStatusError):
                 await client._execute_query(query)
 
         # Verify MAX_RETRIES (3) attempts were made
         assert mock_post.call_count == 3
 
+        # Backoff delays are decorrelated: each within [base, 3 * previous], capped
+        first, second = (call.args[0] for call in sleep.await_args_list)
+        assert client.RETRY_BASE_DELAY <= first <= client.RETRY_BASE_DELAY * 3
+        assert client.RETRY_BASE_DELAY <= second <= min(first * 3, client.RETRY_MAX_DELAY)
+
     async def test_search_repositories_empty_results(self):
         """GIVEN GitHub API returns empty search results
         WHEN search_repositories is called
@@ -198,6 +276,69 @@ class TestGitHubGraphQLClient:
         assert len(warnings) > 0
         assert any("incomplete" in w.lower() or "1000" in w for w in warnings)
 
+    async def test_incomplete_warning_emitted_once_across_pages(self):
+        """GIVEN two result pages that both report 1000 matches
+        WHEN search_repositories paginates through them
+        THEN the incomplete-results warning appears exactly once
+        """
+        client = GitHubGraphQLClient("valid_token")
+        request = httpx.Request("POST", GitHubGraphQLClient.GRAPHQL_URL)
+        pages = [
+            {"hasNextPage": True, "endCursor": "cursor1"},
+            {"hasNextPage": False, "endCursor": None},
+        ]
+        responses = [
+            httpx.Response(
+                200,
+                json={
+                    "data": {
+                        "search": {"repositoryCount": 1000, "edges": [], "pageInfo": page},
+                        "rateLimit": {"remaining": 5000},
+                    }
+                },
+                request=request,
+            )
+            for page in pages
+        ]
+
+        with patch("httpx.AsyncClient.post", AsyncMock(side_effect=responses)):
+            _, warnings = await client.search_repositories(SearchFilters(languages=["Go"]))
+
+        assert sum("incomplete" in w.lower() for w in warnings) == 1
+
+    async def test_nodes_without_database_id_are_skipped(self):
+        """GIVEN a search page with one node whose databaseId is null
+        WHEN search_repositories is called
+        THEN only the node with an id becomes a RepoMetadata
+        """
+        client = GitHubGraphQLClient("valid_token")
+        base = {
+            "owner": {"login": "octo"},
+            "url": "https://github.com/octo/x",
+        }
+        response = httpx.Response(
+            200,
+            json={
+                "data": {
+                    "search": {
+                        "repositoryCount": 2,
+                        "edges": [
+                            {"node": {**base, "databaseId": None, "name": "ghost"}},
+                            {"node": {**base, "databaseId": 5, "name": "real"}},
+                        ],
+                        "pageInfo": {"hasNextPage": False, "endCursor": None},
+                    },
+                    "rateLimit": {"remaining": 5000},
+                }
+            },
+            request=httpx.Request("POST", GitHubGraphQLClient.GRAPHQL_URL),
+        )
+
+        with patch("httpx.AsyncClient.post", AsyncMock(return_value=response)):
+            repos, _ = await client.search_repositories(SearchFilters(languages=["Go"]))
+
+        assert [(r.github_id, r.name) for r in repos] == [(5, "real")]
+
     async def test_search_repositories_rate_limit_stop(self):
         """GIVEN GitHub API response shows rate limit below threshold
         WHEN search_repositories is called with pagination
@@ -321,6 +462,43 @@ class TestGitHubGraphQLClient:
         assert "owner/repo" in readmes
         assert readmes["owner/repo"] is None
 
+    async def test_readme_batches_fetched_concurrently_in_order(self):
+        """GIVEN more repos than fit in one README batch
+        WHEN fetch_readmes is called
+        THEN batches run concurrently up to the limit and results keep input order
+        """
+        # GIVEN
+        client = GitHubGraphQLClient("valid_token")
+        client.README_CONCURRENCY = 2
+        repos = [("owner", f"repo{i}") for i in range(45)]  # 3 batches of <=20
+        in_flight = [0]
+        max_in_flight = [0]
+
+        async def fake_post(url, json):
+            in_flight[0] += 1
+            max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+            variables = json["variables"]
+            texts = {
+                f"repo_{i}": {"object": {"text": variables[f"n{i}"]}}
+                for i in range(len(variables) // 2)
+            }
+            return httpx.Response(
+                status_code=200,
+                json={"data": texts},
+                request=httpx.Request("POST", GitHubGraphQLClient.GRAPHQL_URL),
+            )
+
+        # WHEN
+        with patch("httpx.AsyncClient.post", AsyncMock(side_effect=fake_post)):
+            readmes = await client.fetch_readmes(repos)
+
+        # THEN
+        assert max_in_flight[0] == 2
+        assert list(readmes) == [f"owner/repo{i}" for i in range(45)]
+        assert readmes["owner/repo44"] == "repo44"
+
     async def test_search_skips_null_edge_nodes(self):
         """GIVEN GitHub API returns edges with some null nodes (deleted/inaccessible repos)
         WHEN search_repositories is called
@@ -413,6 +591,20 @@ class TestGitHubGraphQLClient:
         with pytest.raises(ValueError, match="invalid.*characters"):
             await client.fetch_readmes(malicious_repos)
 
+    @pytest.mark.parametrize(
+        "owner,name",
+        [("", "repo"), ("owner", "repo\n"), ("ownér", "repo"), ("owner", "re po")],
+    )
+    async def test_fetch_readmes_rejects_empty_or_non_ascii_names(self, owner, name):
+        """GIVEN an empty name, trailing newline, non-ASCII letter or space
+        WHEN fetch_readmes is called
+        THEN ValueError is raised before any request
+        """
+        client = GitHubGraphQLClient("valid_token")
+
+        with pytest.raises(ValueError, match="invalid.*characters"):
+            await client.fetch_readmes([(owner, name)])
+
     async def test_graphql_error_response_raises_value_error(self):
         """GIVEN GitHub API returns 200 with errors array and data=None
         WHEN _execute_query is called
@@ -445,6 +637,173 @@ class TestGitHubGraphQLClient:
         assert filters.max_stars >= 200000
 
 
+    async def test_queries_share_pooled_client_with_auth_headers(self):
+        """GIVEN a client instance
+        WHEN several queries are executed and the client is closed
+        THEN every request goes through one pooled client carrying the auth header
+        """
+        # GIVEN
+        client = GitHubGraphQLClient("valid_token")
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={"data": {"ok": True}})
+
+        # WHEN
+        with patch.object(client._http, "_transport", httpx.MockTransport(handler)):
+            await client._execute_query("{ a }")
+            await client._execute_query("{ b }")
+        await client.aclose()
+
+        # THEN
+        assert len(seen) == 2
+        assert all(r.headers["Authorization"] == "Bearer valid_token" for r in seen)
+        assert client._http.is_closed
+
+
+@pytest.mark.anyio
+class TestRateLimitBudget:
+    """Test suite for the shared GraphQL rate-limit budget."""
+
+    async def test_low_budget_with_near_reset_waits_then_continues_paging(self):
+        """GIVEN a first page reporting a low budget that resets in ~10 seconds
+        WHEN search_repositories is called
+        THEN it sleeps until the reset and fetches the next page without warnings
+        """
+        client = GitHubGraphQLClient("valid_token")
+        reset_at = (datetime.now(UTC) + timedelta(seconds=10)).isoformat()
+        first = {
+            "data": {
+                "search": {
+                    "repositoryCount": 2,
+                    "edges": [],
+                    "pageInfo": {"hasNextPage": True, "endCursor": "cursor1"},
+                },
+                "rateLimit": {"remaining": 50, "resetAt": reset_at},
+            }
+        }
+        second = {
+            "data": {
+                "search": {
+                    "repositoryCount": 2,
+                    "edges": [],
+                    "pageInfo": {"hasNextPage": False, "endCursor": None},
+                },
+                "rateLimit": {"remaining": 5000, "resetAt": reset_at},
+            }
+        }
+        request = httpx.Request("POST", GitHubGraphQLClient.GRAPHQL_URL)
+        mock_post = AsyncMock(
+            side_effect=[
+                httpx.Response(200, json=first, request=request),
+                httpx.Response(200, json=second, request=request),
+            ]
+        )
+
+        with (
+            patch("httpx.AsyncClient.post", mock_post),
+            patch("app.services.github_client.asyncio.sleep", new_callable=AsyncMock) as sleep,
+        ):
+            _, warnings = await client.search_repositories(SearchFilters(languages=["Python"]))
+
+        assert mock_post.call_count == 2
+        assert warnings == []
+        sleep.assert_awaited_once()
+        assert 0 < sleep.await_args.args[0] <= 10
+
+    async def test_distant_reset_is_not_waited_out(self):
+        budget = RateLimitBudget()
+        reset_at = datetime.now(UTC) + timedelta(hours=1)
+        budget.update({"remaining": 0, "resetAt": reset_at.isoformat()})
+
+        with patch("app.services.github_client.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            await budget.wait_if_low()
+
+        sleep.assert_not_awaited()
+        assert budget.is_low()
+
+    async def test_healthy_budget_does_not_wait(self):
+        budget = RateLimitBudget()
+        budget.update({"remaining": 4000, "resetAt": datetime.now(UTC).isoformat()})
+
+        with patch("app.services.github_client.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            await budget.wait_if_low()
+
+        sleep.assert_not_awaited()
+
+
+class TestTruncateReadme:
+    """Test suite for word-boundary README truncation."""
+
+    def test_short_text_is_returned_unchanged(self):
+        text = "short readme"
+        assert _truncate_readme(text, 100) is text
+
+    def test_cuts_at_last_whitespace_before_limit(self):
+        assert _truncate_readme("alpha beta\ngamma delta", 14) == "alpha beta"
+
+    def test_space_exactly_at_limit_keeps_full_word(self):
+        assert _truncate_readme("alpha beta gamma", 10) == "alpha beta"
+
+    def test_text_without_whitespace_is_cut_at_limit(self):
+        assert _truncate_readme("x" * 50, 20) == "x" * 20
+
+    def test_whitespace_far_before_limit_is_not_used(self):
+        # GIVEN a short title followed by a long unbroken blob
+        text = "# Title\n" + "A" * 20000
+
+        # WHEN truncating to 16000 characters
+        result = _truncate_readme(text, 16000)
+
+        # THEN the blob is cut at the limit, not back at the title's newline
+        assert len(result) == 16000
+
+
+class TestParseRepoNode:
+    """Test suite for building RepoMetadata from search nodes."""
+
+    def test_matches_validated_model(self):
+        node = {
+            "databaseId": 7,
+            "owner": {"login": "octo"},
+            "name": "repo",
+            "url": "https://github.com/octo/repo",
+            "description": None,
+            "primaryLanguage": None,
+            "languages": {"nodes": [{"name": "Go"}]},
+            "stargazerCount": 3,
+            "forkCount": 1,
+            "issues": {"totalCount": 2},
+            "repositoryTopics": {"nodes": [{"topic": {"name": "cli"}}]},
+            "licenseInfo": {"spdxId": "MIT"},
+            "pushedAt": "2024-01-01T00:00:00Z",
+            "createdAt": "2023-01-01T00:00:00Z",
+            "goodFirstIssues": None,
+            "helpWantedIssues": {"totalCount": 4},
+        }
+
+        repo = _parse_repo_node(node)
+
+        assert repo == RepoMetadata.model_validate(repo.model_dump())
+        assert repo.languages == ["Go"]
+        assert repo.topics == ["cli"]
+        assert repo.good_first_issue_count == 0
+
+
+class TestBuildReadmeQuery:
+    """Test suite for the variable-based README batch query."""
+
+    def test_repo_names_are_variables_not_inlined(self):
+        query = _build_readme_query(2)
+
+        assert query.startswith("query($o0: String!, $n0: String!, $o1: String!, $n1: String!)")
+        assert "repo_1: repository(owner: $o1, name: $n1)" in query
+
+    def test_query_is_cached_per_batch_size(self):
+        assert _build_readme_query(20) is _build_readme_query(20)
+
+
 class TestBuildSearchQueryString:
     """Test suite for _build_search_query_string function."""
 
@@ -14,6 +14,7 @@ All tests use temporary SQLite databases via pytest's tmp_path fixture.
 from datetime import UTC, datetime, timedelta
 
 import aiosqlite
+import pytest
 
 from app.schemas.scout import (
     AnalysisResult,
@@ -22,19 +23,27 @@ from app.schemas.scout import (
     SearchFilters,
     SearchRunResponse,
 )
+from app.services.github_client import README_FORMAT_VERSION
 from app.services.github_repos_db import GitHubReposDB
 
 
+@pytest.fixture
+async def db(tmp_path):
+    """A GitHubReposDB on a temporary file, closed after the test."""
+    repos_db = GitHubReposDB(str(tmp_path / "scout.db"))
+    yield repos_db
+    await repos_db.close()
+
+
 class TestGitHubReposDBInit:
     """Test database initialization and setup."""
 
-    async def test_init_creates_tables(self, tmp_path):
+    async def test_init_creates_tables(self, db):
         """
         GIVEN a fresh GitHubReposDB instance
         WHEN _ensure_init is called
-        THEN all 3 tables should exist in sqlite_master (no developer_profiles)
+        THEN all 5 tables should exist in sqlite_master (no developer_profiles)
         """
-        db = GitHubReposDB(str(tmp_path / "scout.db"))
         await db._ensure_init()
 
         async with aiosqlite.connect(db.db_path) as conn:
@@ -46,19 +55,55 @@ class TestGitHubReposDBInit:
             tables = [row[0] for row in await cursor.fetchall()]
 
         expected = [
+            "analysis_cache",
             "analysis_results",
+            "readme_cache",
             "repositories",
             "search_runs",
         ]
         assert tables == expected
 
-    async def test_wal_mode_activated(self, tmp_path):
+    async def test_owner_name_lookup_uses_index(self, db):
+        """
+        GIVEN a fresh GitHubReposDB instance
+        WHEN the analysis insert looks up a repository by owner and name
+        THEN SQLite resolves it through the owner/name index, not a table scan
+        """
+        await db._ensure_init()
+
+        async with aiosqlite.connect(db.db_path) as conn:
+            cursor = await conn.execute(
+                "EXPLAIN QUERY PLAN SELECT github_id FROM repositories "
+                "WHERE owner = ? AND name = ?",
+                ("octo", "repo"),
+            )
+            plan = " ".join(row[3] for row in await cursor.fetchall())
+
+        assert "idx_repositories_owner_name" in plan
+
+    async def test_run_results_lookup_uses_index(self, db):
+        """
+        GIVEN a fresh GitHubReposDB instance
+        WHEN analysis results are looked up by run_id
+        THEN SQLite resolves them through the run_id index, not a table scan
+        """
+        await db._ensure_init()
+
+        async with aiosqlite.connect(db.db_path) as conn:
+            cursor = await conn.execute(
+                "EXPLAIN QUERY PLAN SELECT fit_score FROM analysis_results WHERE run_id = ?",
+                ("run-1",),
+            )
+            plan = " ".join(row[3] for row in await cursor.fetchall())
+
+        assert "idx_analysis_results_run_id" in plan
+
+    async def test_wal_mode_activated(self, db):
         """
         GIVEN a fresh GitHubReposDB instance
         WHEN _ensure_init is called
         THEN WAL journal mode should be active
         """
-        db = GitHubReposDB(str(tmp_path / "scout.db"))
         await db._ensure_init()
 
         async with aiosqlite.connect(db.db_path) as conn:
@@ -71,13 +116,12 @@ class TestGitHubReposDBInit:
 class TestSearchRunOperations:
     """Test search run creation, retrieval, and updates."""
 
-    async def test_create_and_get_search_run(self, tmp_path):
+    async def test_create_and_get_search_run(self, db):
         """
         GIVEN a SearchFilters object
         WHEN create_search_run is called
         THEN get_search_run should return SearchRunResponse with status="running"
         """
-        db = GitHubReposDB(str(tmp_path / "scout.db"))
         filters = SearchFilters(
             languages=["Python"],
             min_stars=50,
@@ -93,25 +137,23 @@ class TestSearchRunOperations:
         assert result.run_id == run_id
         assert result.status == "running"
 
-    async def test_get_search_run_nonexistent_returns_none(self, tmp_path):
+    async def test_get_search_run_nonexistent_returns_none(self, db):
         """
         GIVEN a nonexistent run_id
         WHEN get_search_run is called
         THEN it should return None
         """
-        db = GitHubReposDB(str(tmp_path / "scout.db"))
 
         result = await db.get_search_run("nonexistent-run-id")
 
         assert result is None
 
-    async def test_update_search_run_status_and_totals(self, tmp_path):
+    async def test_update_search_run_status_and_totals(self, db):
         """
         GIVEN an existing search run
         WHEN update_search_run is called with new status and totals
         THEN get_search_run should reflect the updates
         """
-        db = GitHubReposDB(str(tmp_path / "scout.db"))
         filters = SearchFilters(languages=["TypeScript"])
 
         run_id = await db.create_search_run(filters)
@@ -129,13 +171,12 @@ class TestSearchRunOperations:
         # Note: SearchRunResponse doesn't expose totals directly in your schema
         # but the DB should store them for get_search_results
 
-    async def test_get_search_run_filters(self, tmp_path):
+    async def test_get_search_run_filters(self, db):
         """
         GIVEN a search run created with specific filters
         WHEN get_search_run_filters is called
         THEN it should return SearchFilters matching the input
         """
-        db = GitHubReposDB(str(tmp_path / "scout.db"))
         original_filters = SearchFilters(
             languages=["Rust", "Go"],
             min_stars=100,
@@ -155,13 +196,12 @@ class TestSearchRunOperations:
         assert retrieved_filters.topics == ["cli", "performance"]
         assert retrieved_filters.license == "MIT"
 
-    async def test_get_search_run_filters_nonexistent_returns_none(self, tmp_path):
+    async def test_get_search_run_filters_nonexistent_returns_none(self, db):
         """
         GIVEN a nonexistent run_id
         WHEN get_search_run_filters is called
         THEN it should return None
         """
-        db = GitHubReposDB(str(tmp_path / "scout.db"))
 
         result = await db.get_search_run_filters("nonexistent-run-id")
 
@@ -171,13 +211,12 @@ class TestSearchRunOperations:
 class TestRepoOperations:
     """Test repository upsert and deduplication logic."""
 
-    async def test_upsert_deduplicates_by_github_id(self, tmp_path):
+    async def test_upsert_deduplicates_by_github_id(self, db):
         """
         GIVEN a repository metadata record
         WHEN the same github_id is upserted twice with different star_count
         THEN only one row should exist with the updated values
         """
-        db = GitHubReposDB(str(tmp_path / "scout.db"))
         await db._ensure_init()
 
         repo_v1 = RepoMetadata(
@@ -210,13 +249,12 @@ class TestRepoOperations:
         assert row[0] == 1  # Only one row
         assert row[1] == 200  # Updated star count
 
-    async def test_upsert_empty_list_does_nothing(self, tmp_path):
+    async def test_upsert_empty_list_does_nothing(self, db):
         """
         GIVEN an empty repository list
         WHEN upsert_repositories is called
         THEN it should complete without error
         """
-        db = GitHubReposDB(str(tmp_path / "scout.db"))
 
         await db.upsert_repositories([])
 
@@ -226,13 +264,12 @@ class TestRepoOperations:
 class TestAnalysisResults:
     """Test analysis result storage and retrieval with repo joins."""
 
-    async def test_save_and_retrieve_results(self, tmp_path):
+    async def test_save_and_retrieve_results(self, db):
         """
         GIVEN a search run with upserted repos and saved analysis results
         WHEN get_search_results is called
         THEN it should return ScoutSearchResult with results sorted by fit_score desc
         """
-        db = GitHubReposDB(str(tmp_path / "scout.db"))
         filters = SearchFilters(languages=["Python"])
         run_id = await db.create_search_run(filters)
 
@@ -302,25 +339,23 @@ class TestAnalysisResults:
         # Verify repos are included
         assert len(result.repos) == 3
 
-    async def test_get_search_results_unknown_run(self, tmp_path):
+    async def test_get_search_results_unknown_run(self, db):
         """
         GIVEN a nonexistent run_id
         WHEN get_search_results is called
         THEN it should return None
         """
-        db = GitHubReposDB(str(tmp_path / "scout.db"))
 
         result = await db.get_search_results("nonexistent-run-id")
 
         assert result is None
 
-    async def test_get_search_results_no_results(self, tmp_path):
+    async def test_get_search_results_no_results(self, db):
         """
         GIVEN a search run with no saved analysis results
         WHEN get_search_results is called
         THEN it should return ScoutSearchResult with empty results list
         """
-        db = GitHubReposDB(str(tmp_path / "scout.db"))
         filters = SearchFilters(languages=["Python"])
         run_id = await db.create_search_run(filters)
 
@@ -332,13 +367,12 @@ class TestAnalysisResults:
         assert result.results == []
         assert result.repos == []
 
-    async def test_save_analysis_results_empty_list_does_nothing(self, tmp_path):
+    async def test_save_analysis_results_empty_list_does_nothing(self, db):
         """
         GIVEN an empty analysis results list
         WHEN save_analysis_results is called
         THEN it should complete without error
         """
-        db = GitHubReposDB(str(tmp_path / "scout.db"))
         filters = SearchFilters(languages=["Python"])
         run_id = await db.create_search_run(filters)
 
@@ -346,13 +380,12 @@ class TestAnalysisResults:
 
         # Should not raise an exception
 
-    async def test_save_analysis_results_skips_unknown_repos(self, tmp_path):
+    async def test_save_analysis_results_skips_unknown_repos(self, db):
         """
         GIVEN an analysis result for a repo not in the repositories table
         WHEN save_analysis_results is called
         THEN it should skip that result without error
         """
-        db = GitHubReposDB(str(tmp_path / "scout.db"))
         filters = SearchFilters(languages=["Python"])
         run_id = await db.create_search_run(filters)
 
@@ -373,16 +406,208 @@ class TestAnalysisResults:
         assert result.repos == []
 
 
+class TestReadmeCache:
+    """Test the README cache keyed by owner, name and pushed_at."""
+
+    @staticmethod
+    def _repo(name: str, pushed_at: str | None) -> RepoMetadata:
+        return RepoMetadata(
+            github_id=1,
+            owner="octo",
+            name=name,
+            url=f"https://github.com/octo/{name}",
+            pushed_at=pushed_at,
+        )
+
+    async def test_round_trip_includes_missing_readmes(self, db):
+        """
+        GIVEN READMEs saved for two repos, one of which has no README
+        WHEN get_cached_readmes is called with the same pushed_at values
+        THEN both are hits, the README-less one as None
+        """
+        repos = [self._repo("a", "2024-01-01T00:00:00Z"), self._repo("b", "2024-01-02T00:00:00Z")]
+        await db.save_readmes(repos, {"octo/a": "# A", "octo/b": None})
+
+        cached = await db.get_cached_readmes(repos)
+
+        assert cached == {"octo/a": "# A", "octo/b": None}
+
+    async def test_new_push_misses_cache(self, db):
+        """
+        GIVEN a README cached at one pushed_at
+        WHEN the repo is looked up with a newer pushed_at
+        THEN it is a miss
+        """
+        await db.save_readmes([self._repo("a", "2024-01-01T00:00:00Z")], {"octo/a": "# A"})
+
+        cached = await db.get_cached_readmes([self._repo("a", "2024-02-01T00:00:00Z")])
+
+        assert cached == {}
+
+    async def test_repos_without_pushed_at_are_not_cached(self, db):
+        repo = self._repo("a", None)
+        await db.save_readmes([repo], {"octo/a": "# A"})
+
+        assert await db.get_cached_readmes([repo]) == {}
+
+    async def test_save_prunes_expired_entries(self, db):
+        """
+        GIVEN a cache entry fetched more than 30 days ago
+        WHEN another README is saved
+        THEN the expired entry is removed in the same write
+        """
+        await db._ensure_init()
+        stale = (datetime.now(tz=UTC) - timedelta(days=31)).isoformat()
+        async with aiosqlite.connect(db.db_path) as conn:
+            await conn.execute(
+                "INSERT INTO readme_cache VALUES (?, ?, ?, ?, ?, ?)",
+                ("octo", "a", "2024-01-01T00:00:00Z", README_FORMAT_VERSION, "# A", stale),
+            )
+            await conn.commit()
+
+        await db.save_readmes([self._repo("b", "2024-01-01T00:00:00Z")], {"octo/b": "# B"})
+
+        assert await db.get_cached_readmes([self._repo("a", "2024-01-01T00:00:00Z")]) == {}
+
+    async def test_entries_from_another_format_version_miss(self, db):
+        """
+        GIVEN a README cached under an older format version
+        WHEN it is looked up
+        THEN it is a miss, so text truncated under old rules is refetched
+        """
+        await db._ensure_init()
+        now = datetime.now(tz=UTC).isoformat()
+        async with aiosqlite.connect(db.db_path) as conn:
+            await conn.execute(
+                "INSERT INTO readme_cache VALUES (?, ?, ?, ?, ?, ?)",
+                ("octo", "a", "2024-01-01T00:00:00Z", README_FORMAT_VERSION - 1, "# A", now),
+            )
+            await conn.commit()
+
+        assert await db.get_cached_readmes([self._repo("a", "2024-01-01T00:00:00Z")]) == {}
+
+    async def test_unversioned_cache_table_is_replaced(self, db):
+        """
+        GIVEN a readme_cache table from before entries were versioned
+        WHEN the database initializes
+        THEN the table is recreated with the version column
+        """
+        async with aiosqlite.connect(db.db_path) as conn:
+            await conn.execute(
+                "CREATE TABLE readme_cache (owner TEXT, name TEXT, pushed_at TEXT,"
+                " text TEXT, fetched_at TEXT, PRIMARY KEY (owner, name, pushed_at))"
+            )
+            await conn.commit()
+
+        repo = self._repo("a", "2024-01-01T00:00:00Z")
+        await db.save_readmes([repo], {"octo/a": "# A"})
+
+        assert await db.get_cached_readmes([repo]) == {"octo/a": "# A"}
+
+
+class TestAnalysisCache:
+    """Test the analysis cache keyed by search profile, github_id and pushed_at."""
+
+    @staticmethod
+    def _repo(github_id: int, name: str, pushed_at: str | None) -> RepoMetadata:
+        return RepoMetadata(
+            github_id=github_id,
+            owner="octo",
+            name=name,
+            url=f"https://github.com/octo/{name}",
+            pushed_at=pushed_at,
+        )
+
+    @staticmethod
+    def _result(name: str) -> AnalysisResult:
+        return AnalysisResult(
+            repo=f"octo/{name}",
+            fit_score=7.5,
+            reason="Good fit",
+            contributions=["Docs"],
+        )
+
+    async def test_round_trip_for_same_profile(self, db):
+        """
+        GIVEN an analysis saved for a repo
+        WHEN it is looked up with the same filters and pushed_at
+        THEN the cached result is returned under the repo's github_id
+        """
+        filters = SearchFilters(languages=["Python"], topics=["cli"])
+        repo = self._repo(1, "a", "2024-01-01T00:00:00Z")
+        await db.save_analyses(filters, [repo], [self._result("a")])
+
+        cached = await db.get_cached_analyses(filters, [repo])
+
+        assert cached == {1: self._result("a")}
+
+    async def test_star_range_does_not_split_profile(self, db):
+        filters = SearchFilters(languages=["Python"], min_stars=10)
+        repo = self._repo(1, "a", "2024-01-01T00:00:00Z")
+        await db.save_analyses(filters, [repo], [self._result("a")])
+
+        cached = await db.get_cached_analyses(
+            filters.model_copy(update={"min_stars": 500}), [repo]
+        )
+
+        assert 1 in cached
+
+    async def test_other_profile_or_new_push_misses(self, db):
+        """
+        GIVEN an analysis cached for one profile and pushed_at
+        WHEN looked up with other topics or a newer pushed_at
+        THEN both are misses
+        """
+        filters = SearchFilters(languages=["Python"], topics=["cli"])
+        await db.save_analyses(
+            filters, [self._repo(1, "a", "2024-01-01T00:00:00Z")], [self._result("a")]
+        )
+
+        other_topics = filters.model_copy(update={"topics": ["web"]})
+        assert await db.get_cached_analyses(
+            other_topics, [self._repo(1, "a", "2024-01-01T00:00:00Z")]
+        ) == {}
+        assert await db.get_cached_analyses(
+            filters, [self._repo(1, "a", "2024-02-01T00:00:00Z")]
+        ) == {}
+
+    async def test_results_for_unknown_repos_are_skipped(self, db):
+        filters = SearchFilters(languages=["Python"])
+        repo = self._repo(1, "a", "2024-01-01T00:00:00Z")
+        await db.save_analyses(filters, [repo], [self._result("other")])
+
+        assert await db.get_cached_analyses(filters, [repo]) == {}
+
+    async def test_save_prunes_expired_entries(self, db):
+        """
+        GIVEN an analysis cached more than 30 days ago
+        WHEN another analysis is saved
+        THEN the expired entry is removed in the same write
+        """
+        filters = SearchFilters(languages=["Python"])
+        repo_a = self._repo(1, "a", "2024-01-01T00:00:00Z")
+        await db.save_analyses(filters, [repo_a], [self._result("a")])
+        stale = (datetime.now(tz=UTC) - timedelta(days=31)).isoformat()
+        async with aiosqlite.connect(db.db_path) as conn:
+            await conn.execute("UPDATE analysis_cache SET analyzed_at = ?", (stale,))
+            await conn.commit()
+
+        await db.save_analyses(
+            filters, [self._repo(2, "b", "2024-01-01T00:00:00Z")], [self._result("b")]
+        )
+
+        assert await db.get_cached_analyses(filters, [repo_a]) == {}
+
+
 class TestPruning:
     """Test stale repository pruning logic."""
 
-    async def test_prune_deletes_stale_unreferenced_repos(self, tmp_path):
+    async def test_prune_deletes_stale_unreferenced_repos(self, db):
         """
         GIVEN repos with last_seen_at > 30 days ago
         WHEN prune_stale_repos is called
         THEN those repos should be deleted
         """
-        db = GitHubReposDB(str(tmp_path / "scout.db"))
         await db._ensure_init()
 
         stale_date = datetime.now(tz=UTC) - timedelta(days=31)
@@ -417,13 +642,12 @@ class TestPruning:
 
         assert count == 0
 
-    async def test_prune_keeps_referenced_repos(self, tmp_path):
+    async def test_prune_keeps_referenced_repos(self, db):
         """
         GIVEN old repos attached to analysis results
         WHEN prune_stale_repos is called
         THEN those repos should NOT be deleted
         """
-        db = GitHubReposDB(str(tmp_path / "scout.db"))
         await db._ensure_init()
 
         stale_date = datetime.now(tz=UTC) - timedelta(days=31)
@@ -470,13 +694,12 @@ class TestPruning:
 
         assert count == 1
 
-    async def test_prune_keeps_recent_repos(self, tmp_path):
+    async def test_prune_keeps_recent_repos(self, db):
         """
         GIVEN repos with last_seen_at < 30 days ago
         WHEN prune_stale_repos is called
         THEN those repos should NOT be deleted
         """
-        db = GitHubReposDB(str(tmp_path / "scout.db"))
         await db._ensure_init()
 
         recent_date = datetime.now(tz=UTC) - timedelta(days=10)
@@ -510,3 +733,73 @@ class TestPruning:
             count = (await cursor.fetchone())[0]
 
         assert count == 1
+
+
+class TestSharedConnection:
+    """Test the long-lived connection shared by all operations."""
+
+    async def test_operations_reuse_one_connection(self, db):
+        """
+        GIVEN an initialized GitHubReposDB
+        WHEN several operations run
+        THEN they all use the same underlying connection
+        """
+        run_id = await db.create_search_run(SearchFilters(languages=["Python"]))
+        conn = db._db
+
+        await db.update_search_run(run_id, "completed")
+        await db.get_search_run(run_id)
+
+        assert conn is not None
+        assert db._db is conn
+
+    async def test_connection_pragmas_applied(self, db):
+        """
+        GIVEN an initialized GitHubReposDB
+        WHEN reading pragmas on its shared connection
+        THEN the WAL tuning settings are in effect
+        """
+        await db._ensure_init()
+
+        async with db._connect() as conn:
+            synchronous = (await (await conn.execute("PRAGMA synchronous")).fetchone())[0]
+            cache_size = (await (await conn.execute("PRAGMA cache_size")).fetchone())[0]
+            temp_store = (await (await conn.execute("PRAGMA temp_store")).fetchone())[0]
+
+        assert synchronous == 1  # NORMAL
+        assert cache_size == -65536
+        assert temp_store == 2  # MEMORY
+
+    async def test_close_then_reopen_on_next_use(self, db):
+        """
+        GIVEN a GitHubReposDB with an open connection
+        WHEN close is called and the DB is used again
+        THEN the connection is released and transparently reopened
+        """
+        run_id = await db.create_search_run(SearchFilters(languages=["Python"]))
+
+        await db.close()
+        assert db._db is None
+
+        run = await db.get_search_run(run_id)
+        assert run is not None
+        assert db._db is not None
+
+    async def test_failed_write_is_rolled_back(self, db):
+        """
+        GIVEN a write transaction that fails part-way
+        WHEN the next operation commits on the shared connection
+        THEN the failed write's rows are not persisted
+        """
+        await db._ensure_init()
+
+        with pytest.raises(RuntimeError):
+            async with db._write() as conn:
+                await conn.execute(
+                    "INSERT INTO search_runs (id, filters, status, started_at) "
+                    "VALUES ('partial', '{}', 'running', '2026-01-01')"
+                )
+                raise RuntimeError("boom")
+        await db.create_search_run(SearchFilters(languages=["Python"]))
+
+        assert await db.get_search_run("partial") is None
@@ -83,6 +83,26 @@ class TestIsTutorialOrAwesomeList:
         # THEN it should return False (only separated "awesome-*" is filtered)
         assert result is False
 
+    def test_keyword_inside_longer_word_is_not_a_match(self):
+        # GIVEN a repo whose name merely contains "course"
+        repo = _make_repo(name="discourse", description="Community discussion platform")
+
+        # WHEN checking if it's a tutorial/awesome-list
+        result = is_tutorial_or_awesome_list(repo)
+
+        # THEN word boundaries still apply after the keyword prefilter
+        assert result is False
+
+    def test_detects_keyword_case_insensitively(self):
+        # GIVEN a repo with an upper-case curated-list description
+        repo = _make_repo(name="things", description="A CURATED LIST of things")
+
+        # WHEN checking if it's a tutorial/awesome-list
+        result = is_tutorial_or_awesome_list(repo)
+
+        # THEN it should return True
+        assert result is True
+
 
 class TestHasOpenIssues:
     """Tests for checking if repository has open issues."""
@@ -34,6 +34,16 @@ class TestWhitespaceNormalization:
         # THEN tabs and newlines become single space
         assert result == "hello world"
 
+    def test_normalizes_unicode_whitespace(self):
+        # GIVEN text with non-breaking and ideographic spaces
+        text = "hello\u00a0\u3000world"
+
+        # WHEN sanitizing the input
+        result = sanitize_input(text)
+
+        # THEN they are collapsed like ASCII whitespace
+        assert result == "hello world"
+
     def test_handles_only_whitespace(self):
         # GIVEN text containing only whitespace characters
         text = "   \t\n   "
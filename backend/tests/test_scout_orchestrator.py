@@ -73,15 +73,80 @@ def make_analysis_result(owner: str = "org", name: str = "repo") -> AnalysisResu
 
 async def collect_events(gen):
     """Collect all events from an async generator."""
-    events = []
-    async for event in gen:
-        events.append(event)
-    return events
+    return [event async for event in gen]
 
 
 # Tests
 
 
+@pytest.mark.asyncio
+async def test_fetch_readmes_only_requests_cache_misses():
+    """GIVEN one repo with a cached README and one without
+    WHEN _fetch_readmes runs
+    THEN only the miss is fetched from GitHub and saved to the cache
+    """
+    from app.services.scout_orchestrator import _fetch_readmes
+
+    cached_repo = make_repo("org1", "repo1")
+    new_repo = make_repo("org2", "repo2")
+    mock_client = AsyncMock()
+    mock_client.fetch_readmes = AsyncMock(return_value={"org2/repo2": "# README 2"})
+
+    with patch("app.services.scout_orchestrator.github_repos_db") as mock_db:
+        mock_db.get_cached_readmes = AsyncMock(return_value={"org1/repo1": "# README 1"})
+        mock_db.save_readmes = AsyncMock()
+
+        readmes = await _fetch_readmes(mock_client, [cached_repo, new_repo])
+
+    assert readmes == ["# README 1", "# README 2"]
+    mock_client.fetch_readmes.assert_awaited_once_with([("org2", "repo2")])
+    mock_db.save_readmes.assert_awaited_once_with([new_repo], {"org2/repo2": "# README 2"})
+
+
+@pytest.mark.asyncio
+async def test_fetch_and_analyze_batch_only_analyzes_cache_misses():
+    """GIVEN one repo with a cached analysis and one without
+    WHEN _fetch_and_analyze_batch runs
+    THEN only the miss has its README fetched and goes to the LLM, and its
+    result is saved to the analysis cache
+    """
+    import asyncio
+
+    from app.services.scout_orchestrator import _fetch_and_analyze_batch
+
+    filters = make_filters()
+    cached_repo = make_repo("org1", "repo1").model_copy(update={"github_id": 1})
+    new_repo = make_repo("org2", "repo2").model_copy(update={"github_id": 2})
+    cached_result = make_analysis_result("org1", "repo1")
+    fresh_result = make_analysis_result("org2", "repo2")
+    mock_client = AsyncMock()
+    mock_client.fetch_readmes = AsyncMock(return_value={"org2/repo2": "# README 2"})
+
+    with (
+        patch("app.services.scout_orchestrator.github_repos_db") as mock_db,
+        patch("app.services.scout_orchestrator.task_registry", create=True) as mock_registry,
+        patch(
+            "app.services.scout_orchestrator.analyze_batch",
+            new_callable=AsyncMock,
+            return_value=[fresh_result],
+        ) as mock_analyze,
+    ):
+        mock_db.get_cached_analyses = AsyncMock(return_value={1: cached_result})
+        mock_db.save_analyses = AsyncMock()
+        mock_db.get_cached_readmes = AsyncMock(return_value={})
+        mock_db.save_readmes = AsyncMock()
+        mock_registry.is_cancelled = MagicMock(return_value=False)
+
+        results = await _fetch_and_analyze_batch(
+            asyncio.Semaphore(1), mock_client, filters, [cached_repo, new_repo], "run-1"
+        )
+
+    assert results == [cached_result, fresh_result]
+    mock_client.fetch_readmes.assert_awaited_once_with([("org2", "repo2")])
+    mock_analyze.assert_awaited_once_with(filters, [new_repo], ["# README 2"], "run-1")
+    mock_db.save_analyses.assert_awaited_once_with(filters, [new_repo], [fresh_result])
+
+
 @pytest.mark.asyncio
 async def test_full_successful_pipeline():
     """
@@ -127,11 +192,16 @@ async def test_full_successful_pipeline():
         mock_analyze.return_value = analysis_results
 
         mock_db.upsert_repositories = AsyncMock()
+        mock_db.get_cached_readmes = AsyncMock(return_value={})
+        mock_db.save_readmes = AsyncMock()
+        mock_db.get_cached_analyses = AsyncMock(return_value={})
+        mock_db.save_analyses = AsyncMock()
         mock_db.save_analysis_results = AsyncMock()
         mock_db.update_search_run = AsyncMock()
 
         mock_settings.scout_max_repos = 50
         mock_settings.scout_batch_size = 5
+        mock_settings.scout_max_concurrent_batches = 4
 
         # WHEN
         events = await collect_events(scout_search_stream(filters, run_id))
@@ -164,6 +234,7 @@ async def test_full_successful_pipeline():
         mock_db.upsert_repositories.assert_awaited_once_with(repos)
         mock_db.save_analysis_results.assert_awaited_once_with(run_id, analysis_results)
         mock_db.update_search_run.assert_awaited_once()
+        mock_client.aclose.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -292,11 +363,16 @@ async def test_partial_batch_failure_yields_partial_status():
         mock_analyze.side_effect = [results_batch1, Exception("Analysis failed")]
 
         mock_db.upsert_repositories = AsyncMock()
+        mock_db.get_cached_readmes = AsyncMock(return_value={})
+        mock_db.save_readmes = AsyncMock()
+        mock_db.get_cached_analyses = AsyncMock(return_value={})
+        mock_db.save_analyses = AsyncMock()
         mock_db.save_analysis_results = AsyncMock()
         mock_db.update_search_run = AsyncMock()
 
         mock_settings.scout_max_repos = 50
         mock_settings.scout_batch_size = 2
+        mock_settings.scout_max_concurrent_batches = 4
 
         # WHEN
         events = await collect_events(scout_search_stream(filters, run_id))
@@ -428,6 +504,10 @@ async def test_cancellation_after_filtering_exits_early():
 
         mock_apply_filters.return_value = repos
         mock_db.upsert_repositories = AsyncMock()
+        mock_db.get_cached_readmes = AsyncMock(return_value={})
+        mock_db.save_readmes = AsyncMock()
+        mock_db.get_cached_analyses = AsyncMock(return_value={})
+        mock_db.save_analyses = AsyncMock()
         mock_db.update_search_run = AsyncMock()
 
         # WHEN
@@ -470,7 +550,6 @@ async def test_cancellation_after_readme_fetch_exits_early():
         patch("app.services.scout_orchestrator.create_github_client") as mock_create_client,
         patch("app.services.scout_orchestrator.task_registry", create=True) as mock_task_registry,
         patch("app.services.scout_orchestrator.apply_filters") as mock_apply_filters,
-        patch("app.services.scout_orchestrator.batch_repos"),
         patch(
             "app.services.scout_orchestrator.analyze_batch",
             new_callable=AsyncMock,
@@ -483,11 +562,18 @@ async def test_cancellation_after_readme_fetch_exits_early():
         mock_client.fetch_readmes = AsyncMock(return_value={"org1/repo1": "# README 1"})
         mock_create_client.return_value = mock_client
 
-        # is_cancelled returns False twice (discovery, filtering), True on third call (after README)
-        mock_task_registry.is_cancelled = MagicMock(side_effect=[False, False, True])
+        # is_cancelled returns False for discovery, filtering and the first analysis
+        # wait, then True in the batch once its README fetch has finished
+        mock_task_registry.is_cancelled = MagicMock(
+            side_effect=[False, False, False, True]
+        )
 
         mock_apply_filters.return_value = repos
         mock_db.upsert_repositories = AsyncMock()
+        mock_db.get_cached_readmes = AsyncMock(return_value={})
+        mock_db.save_readmes = AsyncMock()
+        mock_db.get_cached_analyses = AsyncMock(return_value={})
+        mock_db.save_analyses = AsyncMock()
         mock_db.update_search_run = AsyncMock()
 
         # WHEN
@@ -499,7 +585,8 @@ async def test_cancellation_after_readme_fetch_exits_early():
         cancelled_events = [e for e in status_events if e.get("status") == "cancelled"]
         assert len(cancelled_events) > 0
 
-        # Should NOT call analyze_batch
+        # READMEs were fetched, but analyze_batch was never called
+        mock_client.fetch_readmes.assert_awaited_once()
         mock_analyze.assert_not_called()
 
         # Should update run status to cancelled
@@ -550,29 +637,38 @@ async def test_run_analysis_cancels_remaining_tasks_on_cancellation():
         mock_client.fetch_readmes = AsyncMock(return_value={})
         mock_create_client.return_value = mock_client
 
-        # is_cancelled returns False for discovery/filtering/readme, True during analysis
-        # We need it to return False enough times to get into analysis, then True
-        mock_task_registry.is_cancelled = MagicMock(side_effect=[False, False, False, True])
+        # Cancelled once both batches have started analysis: the first finishes
+        # at once, the second is still running when the loop sees the cancel
+        mock_task_registry.is_cancelled = MagicMock(
+            side_effect=lambda _run_id: mock_analyze.await_count >= 2
+        )
 
         mock_apply_filters.return_value = repos
         mock_batch_repos.return_value = [batch1, batch2]
 
         # First batch succeeds, but cancellation happens before second batch completes
-        async def slow_batch_analysis(*args, **kwargs):
+        async def slow_batch_analysis(filters, batch, readmes, run_id):
             # Simulate slow analysis to ensure cancellation happens mid-iteration
             import asyncio
 
+            if batch == batch1:
+                return results_batch1
             await asyncio.sleep(0.1)
             return [make_analysis_result(owner="org3", name="repo3")]
 
-        mock_analyze.side_effect = [results_batch1, slow_batch_analysis()]
+        mock_analyze.side_effect = slow_batch_analysis
 
         mock_db.upsert_repositories = AsyncMock()
+        mock_db.get_cached_readmes = AsyncMock(return_value={})
+        mock_db.save_readmes = AsyncMock()
+        mock_db.get_cached_analyses = AsyncMock(return_value={})
+        mock_db.save_analyses = AsyncMock()
         mock_db.save_analysis_results = AsyncMock()
         mock_db.update_search_run = AsyncMock()
 
         mock_settings.scout_max_repos = 50
         mock_settings.scout_batch_size = 2
+        mock_settings.scout_max_concurrent_batches = 4
 
         # WHEN
         events = await collect_events(scout_search_stream(filters, run_id))
@@ -763,3 +859,50 @@ async def test_no_relaxation_when_initial_search_succeeds():
 
         # upsert_repositories was called
         mock_db.upsert_repositories.assert_awaited_once_with([repo1])
+
+
+@pytest.mark.asyncio
+async def test_run_analysis_caps_concurrent_batches():
+    """
+    GIVEN 6 batches and scout_max_concurrent_batches=2
+    WHEN _run_analysis runs them
+    THEN no more than 2 analyze_batch calls are in flight at once
+    """
+    import asyncio
+
+    from app.services.scout_orchestrator import _run_analysis
+
+    repos = [make_repo(owner=f"org{i}", name=f"repo{i}") for i in range(6)]
+    in_flight = 0
+    peak = 0
+
+    async def tracked_analysis(filters, batch, readmes, run_id):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [make_analysis_result(owner=r.owner, name=r.name) for r in batch]
+
+    with (
+        patch("app.services.scout_orchestrator.task_registry", create=True) as mock_registry,
+        patch("app.services.scout_orchestrator.analyze_batch", side_effect=tracked_analysis),
+        patch("app.services.scout_orchestrator.github_repos_db") as mock_db,
+        patch("app.services.scout_orchestrator.settings") as mock_settings,
+    ):
+        mock_registry.is_cancelled = MagicMock(return_value=False)
+        mock_db.get_cached_readmes = AsyncMock(return_value={})
+        mock_db.save_readmes = AsyncMock()
+        mock_db.get_cached_analyses = AsyncMock(return_value={})
+        mock_db.save_analyses = AsyncMock()
+        mock_settings.scout_batch_size = 1
+        mock_settings.scout_max_concurrent_batches = 2
+        mock_client = AsyncMock()
+        mock_client.fetch_readmes = AsyncMock(return_value={})
+
+        results = []
+        async for results, _ in _run_analysis(make_filters(), repos, mock_client, "run-1"):
+            pass
+
+    assert peak == 2
+    assert len(results) == 6
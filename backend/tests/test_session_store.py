@@ -18,3 +18,25 @@ class TestSessionStore:
     def test_get_nonexistent_session(self):
         store = SessionStore()
         assert store.get("nonexistent") is None
+
+    def test_expired_sessions_are_evicted_on_create(self):
+        store = SessionStore(ttl_hours=0)
+        store.create("id-1", "Google", "backend_developer")
+        store.create("id-2", "Meta", "backend_developer")
+        assert "id-1" not in store._sessions
+
+    def test_get_drops_expired_session(self):
+        store = SessionStore(ttl_hours=0)
+        store.create("id-1", "Google", "backend_developer")
+        assert store.get("id-1") is None
+        assert "id-1" not in store._sessions
+
+    def test_least_recently_used_session_is_evicted_at_capacity(self):
+        store = SessionStore(max_size=2)
+        store.create("id-1", "Google", "backend_developer")
+        store.create("id-2", "Meta", "backend_developer")
+        store.get("id-1")  # id-2 becomes least recently used
+        store.create("id-3", "Apple", "backend_developer")
+        assert store.get("id-2") is None
+        assert store.get("id-1") is not None
+        assert store.get("id-3") is not None
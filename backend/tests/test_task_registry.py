@@ -21,7 +21,37 @@ class TestTaskRegistry:
 
         # THEN the result is tracked
         assert "session-1" in registry._active
-        assert result in registry._active["session-1"]
+        assert result in registry._active["session-1"].values()
+
+    def test_unregister_removes_by_identity_not_equality(self):
+        # GIVEN two results that compare equal but are distinct objects
+        registry = TaskRegistry()
+        result1 = MagicMock()
+        result2 = MagicMock()
+        result1.__eq__ = MagicMock(return_value=True)
+        registry.register("session-1", result1)
+        registry.register("session-1", result2)
+
+        # WHEN unregistering the second one
+        registry.unregister("session-1", result2)
+
+        # THEN only that object is removed
+        assert list(registry._active["session-1"].values()) == [result1]
+
+    def test_register_beyond_session_cap_cancels_and_raises(self):
+        # GIVEN a session already at its cap of active runs
+        registry = TaskRegistry(max_per_session=2)
+        registry.register("session-1", MagicMock())
+        registry.register("session-1", MagicMock())
+
+        # WHEN registering one more
+        extra = MagicMock()
+        with pytest.raises(RuntimeError, match="active agent runs"):
+            registry.register("session-1", extra)
+
+        # THEN it is cancelled and not tracked
+        extra.cancel.assert_called_once_with(mode="immediate")
+        assert len(registry._active["session-1"]) == 2
 
     def test_register_multiple_results_for_same_session(self):
         # GIVEN a registry with one result
@@ -35,8 +65,8 @@ class TestTaskRegistry:
 
         # THEN both results are tracked
         assert len(registry._active["session-1"]) == 2
-        assert result1 in registry._active["session-1"]
-        assert result2 in registry._active["session-1"]
+        assert result1 in registry._active["session-1"].values()
+        assert result2 in registry._active["session-1"].values()
 
     def test_register_different_sessions(self):
         # GIVEN a registry
@@ -51,8 +81,8 @@ class TestTaskRegistry:
         # THEN both sessions are tracked separately
         assert "session-1" in registry._active
         assert "session-2" in registry._active
-        assert result1 in registry._active["session-1"]
-        assert result2 in registry._active["session-2"]
+        assert result1 in registry._active["session-1"].values()
+        assert result2 in registry._active["session-2"].values()
 
     def test_unregister_removes_result(self):
         # GIVEN a registry with a result
@@ -79,8 +109,8 @@ class TestTaskRegistry:
 
         # THEN only that result is removed
         assert "session-1" in registry._active
-        assert result1 not in registry._active["session-1"]
-        assert result2 in registry._active["session-1"]
+        assert result1 not in registry._active["session-1"].values()
+        assert result2 in registry._active["session-1"].values()
 
     def test_unregister_nonexistent_session(self):
         # GIVEN an empty registry
@@ -102,7 +132,7 @@ class TestTaskRegistry:
         # WHEN unregistering a result that was never added
         # THEN no error is raised and existing result remains
         registry.unregister("session-1", result2)
-        assert result1 in registry._active["session-1"]
+        assert result1 in registry._active["session-1"].values()
 
     def test_cancel_all_cancels_incomplete_results(self):
         # GIVEN a registry with incomplete results
@@ -212,7 +242,7 @@ class TestTaskRegistry:
         # THEN the new result is immediately cancelled
         result2.cancel.assert_called_once_with(mode="immediate")
         # AND the result is not left in _active (cleaned up)
-        active_results = registry._active.get("session-1", [])
+        active_results = registry._active.get("session-1", {}).values()
         assert "session-1" not in registry._active or result2 not in active_results
 
     def test_cleanup_clears_cancelled_flag(self):
@@ -233,7 +263,7 @@ class TestTaskRegistry:
         result_new.cancel.assert_not_called()
         # AND the new result is in _active
         assert "session-1" in registry._active
-        assert result_new in registry._active["session-1"]
+        assert result_new in registry._active["session-1"].values()
 
     def test_cancel_then_register_then_cleanup_full_cycle(self):
         # GIVEN a registry with an initial result
@@ -265,11 +295,11 @@ class TestTaskRegistry:
         result3.cancel.assert_not_called()
         # AND result3 is in _active
         assert "session-1" in registry._active
-        assert result3 in registry._active["session-1"]
+        assert result3 in registry._active["session-1"].values()
 
     def test_thread_safety_concurrent_register(self):
-        # GIVEN a registry
-        registry = TaskRegistry()
+        # GIVEN a registry with room for 100 runs in one session
+        registry = TaskRegistry(max_per_session=100)
         results = [MagicMock() for _ in range(100)]
 
         # WHEN registering from multiple threads
@@ -377,6 +407,34 @@ class TestRunAgentStreamed:
                 result_mock.cancel.assert_called_once_with(mode="immediate")
                 registry_mock.unregister.assert_called_once_with("session-1", result_mock)
 
+    @pytest.mark.asyncio
+    async def test_caller_cancellation_cancels_run(self):
+        # GIVEN an agent run whose caller is cancelled before the stream yields
+        agent = MagicMock()
+        result_mock = MagicMock()
+
+        async def slow_stream():
+            await asyncio.sleep(10)
+            yield  # Make it an async generator
+
+        result_mock.stream_events = slow_stream
+
+        with patch("app.services.task_registry.Runner.run_streamed", return_value=result_mock):
+            with patch("app.services.task_registry.task_registry") as registry_mock:
+                task = asyncio.create_task(
+                    run_agent_streamed(agent, "test input", "session-1", timeout=10.0)
+                )
+                await asyncio.sleep(0.01)
+
+                # WHEN the calling task is cancelled
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+
+                # THEN the background run is stopped and unregistered
+                result_mock.cancel.assert_called_once_with(mode="immediate")
+                registry_mock.unregister.assert_called_once_with("session-1", result_mock)
+
     @pytest.mark.asyncio
     async def test_exception_during_streaming_cleans_up(self):
         # GIVEN a mock agent that raises during streaming